@@ -14,17 +14,20 @@ load_dotenv()
 import requests
 original_request = requests.Session.request
 
+# Only the signature is long enough to need truncating
+SIGNATURE_HEADER = "KALSHI-ACCESS-SIGNATURE"
+
 def debug_request(self, method, url, **kwargs):
-    print(f"\n{'='*80}")
-    print(f"REQUEST: {method} {url}")
-    print(f"{'='*80}")
-    headers = kwargs.get('headers', {})
+    lines = [f"\n{'='*80}", f"REQUEST: {method} {url}", f"{'='*80}"]
+    # Session headers (e.g. the access key) are merged in by requests; show them too
+    headers = {**self.headers, **(kwargs.get('headers') or {})}
     for key, value in headers.items():
-        if 'SIGNATURE' in key:
-            print(f"{key}: {value[:50]}...{value[-20:]}")
+        if key == SIGNATURE_HEADER:
+            lines.append(f"{key}: {value[:50]}...{value[-20:]}")
         else:
-            print(f"{key}: {value}")
-    print(f"{'='*80}\n")
+            lines.append(f"{key}: {value}")
+    lines.append(f"{'='*80}\n")
+    print("\n".join(lines))
     return original_request(self, method, url, **kwargs)
 
 requests.Session.request = debug_request
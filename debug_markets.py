@@ -5,6 +5,7 @@ Debug script to check specific Kalshi markets
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from scanner import KalshiClient
 
@@ -36,11 +37,16 @@ def main():
     ]
 
     logger.info("Fetching specific markets...")
+
+    # Issue all market requests at once so the round-trips overlap
+    with ThreadPoolExecutor(max_workers=len(test_tickers)) as executor:
+        futures = {ticker: executor.submit(client.get_market, ticker) for ticker in test_tickers}
+
     for ticker in test_tickers:
         try:
             logger.info(f"\n{'='*60}")
             logger.info(f"Ticker: {ticker}")
-            market = client.get_market(ticker)
+            market = futures[ticker].result()
 
             logger.info(f"Title: {market.get('title')}")
             logger.info(f"Status: {market.get('status')}")
@@ -66,8 +72,16 @@ def main():
     promo_markets = client.get_promo_markets()
     logger.info(f"Total promo markets: {len(promo_markets)}")
 
-    # Filter for weather/temperature
-    weather_markets = [m for m in promo_markets if 'temperature' in m['title'].lower() or 'weather' in m['title'].lower()]
+    # Sort markets into weather and Denver/Miami buckets and collect categories in one pass
+    weather_markets, denver_miami, categories = [], [], set()
+    for m in promo_markets:
+        title = m['title'].lower()
+        if 'temperature' in title or 'weather' in title:
+            weather_markets.append(m)
+        if 'denver' in title or 'miami' in title:
+            denver_miami.append(m)
+        categories.add(m.get('category', 'unknown'))
+
     logger.info(f"Weather/temperature markets: {len(weather_markets)}")
 
     if weather_markets:
@@ -76,7 +90,6 @@ def main():
             logger.info(f"  - {m['ticker']}: {m['title'][:80]}")
 
     # Check for Denver/Miami specifically
-    denver_miami = [m for m in promo_markets if 'denver' in m['title'].lower() or 'miami' in m['title'].lower()]
     logger.info(f"\nDenver/Miami markets: {len(denver_miami)}")
 
     if denver_miami:
@@ -86,7 +99,6 @@ def main():
     else:
         logger.warning("No Denver/Miami markets found in promo markets!")
         logger.info("Checking all categories in promo markets:")
-        categories = set(m.get('category', 'unknown') for m in promo_markets)
         logger.info(f"Categories: {categories}")
 
 if __name__ == "__main__":
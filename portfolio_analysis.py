@@ -9,12 +9,12 @@ Usage:
     python portfolio_analysis.py --budget 100      # Set custom budget
 """
 
-import os
 import sys
 import logging
 import argparse
 from dotenv import load_dotenv
 from scanner import KalshiWeatherScanner, PortfolioOptimizer
+from scanner.auth import CredentialsError, get_auth_kwargs
 
 
 def setup_logging(verbose: bool = False):
@@ -28,57 +28,62 @@ def setup_logging(verbose: bool = False):
 
 def print_portfolio_group(group, optimizer, budget):
     """Print detailed analysis for a portfolio group"""
-    print(f"\n{'=' * 100}")
-    print(f"📊 PORTFOLIO: {group.location} {group.metric.upper()} on {group.date.strftime('%B %d, %Y')}")
-    print(f"{'=' * 100}")
+    # Collect the report and write it once, rather than one print() per line
+    lines = []
 
-    print(f"\n🎯 OVERVIEW:")
-    print(f"  Markets: {len(group.opportunities)}")
-    print(f"  Total Edge: {group.total_edge:+.1%}")
-    print(f"  Sharpe Ratio: {group.sharpe_ratio:.2f}")
-    print(f"  Recommended Allocation: ${group.recommended_allocation * optimizer.bankroll:.2f} ({group.recommended_allocation:.1%} of bankroll)")
+    lines.append(f"\n{'=' * 100}")
+    lines.append(f"📊 PORTFOLIO: {group.location} {group.metric.upper()} on {group.date.strftime('%B %d, %Y')}")
+    lines.append(f"{'=' * 100}")
 
-    print(f"\n💰 EXPECTED RETURNS:")
-    print(f"  Expected: ${group.expected_return:+,.2f}")
-    print(f"  Best Case: ${group.max_return:+,.2f}")
-    print(f"  Worst Case: ${group.min_return:+,.2f}")
+    lines.append(f"\n🎯 OVERVIEW:")
+    lines.append(f"  Markets: {len(group.opportunities)}")
+    lines.append(f"  Total Edge: {group.total_edge:+.1%}")
+    lines.append(f"  Sharpe Ratio: {group.sharpe_ratio:.2f}")
+    lines.append(f"  Recommended Allocation: ${group.recommended_allocation * optimizer.bankroll:.2f} ({group.recommended_allocation:.1%} of bankroll)")
 
-    print(f"\n⚠️ RISK METRICS:")
-    print(f"  Standard Deviation: ${group.std_dev:.2f}")
-    print(f"  Max Drawdown: ${group.max_drawdown:.2f}")
+    lines.append(f"\n💰 EXPECTED RETURNS:")
+    lines.append(f"  Expected: ${group.expected_return:+,.2f}")
+    lines.append(f"  Best Case: ${group.max_return:+,.2f}")
+    lines.append(f"  Worst Case: ${group.min_return:+,.2f}")
+
+    lines.append(f"\n⚠️ RISK METRICS:")
+    lines.append(f"  Standard Deviation: ${group.std_dev:.2f}")
+    lines.append(f"  Max Drawdown: ${group.max_drawdown:.2f}")
 
     # Show all opportunities in the group
-    print(f"\n📋 ALL MARKETS IN GROUP:")
+    lines.append(f"\n📋 ALL MARKETS IN GROUP:")
     for i, opp in enumerate(group.opportunities, 1):
         marker = "⭐" if opp == group.primary_bet else " "
-        print(f"  {marker} {i}. [{opp.edge:+6.1%}] {opp.ticker}")
-        print(f"      {opp.title[:80]}")
-        print(f"      Our Prob: {opp.true_probability:>5.1%} | Market: {opp.recommended_side} @ {opp.market_yes_price if opp.recommended_side == 'YES' else opp.market_no_price:.1%}")
-        print(f"      Recommended: ${opp.recommended_bet_size:.2f}")
+        lines.append(f"  {marker} {i}. [{opp.edge:+6.1%}] {opp.ticker}")
+        lines.append(f"      {opp.title[:80]}")
+        lines.append(f"      Our Prob: {opp.true_probability:>5.1%} | Market: {opp.recommended_side} @ {opp.market_yes_price if opp.recommended_side == 'YES' else opp.market_no_price:.1%}")
+        lines.append(f"      Recommended: ${opp.recommended_bet_size:.2f}")
 
     # Generate hedging strategy
-    print(f"\n🛡️ HEDGING STRATEGY (Budget: ${budget:.2f}):")
+    lines.append(f"\n🛡️ HEDGING STRATEGY (Budget: ${budget:.2f}):")
     strategy = optimizer.generate_hedging_strategy(group, budget)
 
     if strategy:
-        print(f"  Risk Level: {strategy.risk_level}")
-        print(f"  Confidence: {strategy.confidence:.1%}")
-        print(f"\n  PRIMARY POSITION:")
-        print(f"    ${budget * 0.6:.2f} → {strategy.primary.ticker} {strategy.primary.recommended_side}")
-        print(f"    Entry: {strategy.primary.market_yes_price if strategy.primary.recommended_side == 'YES' else strategy.primary.market_no_price:.1%}")
-        print(f"    True Prob: {strategy.primary.true_probability:.1%}")
-        print(f"    Edge: {strategy.primary.edge:+.1%}")
+        lines.append(f"  Risk Level: {strategy.risk_level}")
+        lines.append(f"  Confidence: {strategy.confidence:.1%}")
+        lines.append(f"\n  PRIMARY POSITION:")
+        lines.append(f"    ${budget * 0.6:.2f} → {strategy.primary.ticker} {strategy.primary.recommended_side}")
+        lines.append(f"    Entry: {strategy.primary.market_yes_price if strategy.primary.recommended_side == 'YES' else strategy.primary.market_no_price:.1%}")
+        lines.append(f"    True Prob: {strategy.primary.true_probability:.1%}")
+        lines.append(f"    Edge: {strategy.primary.edge:+.1%}")
 
         if strategy.hedges:
-            print(f"\n  HEDGE POSITIONS:")
+            lines.append(f"\n  HEDGE POSITIONS:")
             for opp, allocation, reason in strategy.hedges:
                 if allocation > 0.50:  # Only show hedges with meaningful allocation
                     price = opp.market_yes_price if opp.recommended_side == "YES" else opp.market_no_price
-                    print(f"    ${allocation:.2f} → {opp.ticker} {opp.recommended_side}")
-                    print(f"      Entry: {price:.1%} | Edge: {opp.edge:+.1%} | Reason: {reason}")
+                    lines.append(f"    ${allocation:.2f} → {opp.ticker} {opp.recommended_side}")
+                    lines.append(f"      Entry: {price:.1%} | Edge: {opp.edge:+.1%} | Reason: {reason}")
+
+        lines.append(f"\n  RETURN RANGE:")
+        lines.append(f"    Expected: ${strategy.expected_return_range[0]:+,.2f} to ${strategy.expected_return_range[1]:+,.2f}")
 
-        print(f"\n  RETURN RANGE:")
-        print(f"    Expected: ${strategy.expected_return_range[0]:+,.2f} to ${strategy.expected_return_range[1]:+,.2f}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -125,16 +130,9 @@ def main():
     print("=" * 100)
 
     # Get credentials
-    api_key_id = os.getenv("KALSHI_API_KEY_ID")
-    private_key_path = os.getenv("KALSHI_PRIVATE_KEY_PATH", "kalshi_api_private_key.txt")
-    email = os.getenv("KALSHI_EMAIL")
-    password = os.getenv("KALSHI_PASSWORD")
-
-    if api_key_id and os.path.exists(private_key_path):
-        auth_kwargs = {"api_key_id": api_key_id, "private_key_path": private_key_path}
-    elif email and password:
-        auth_kwargs = {"email": email, "password": password}
-    else:
+    try:
+        auth_kwargs = get_auth_kwargs()
+    except CredentialsError:
         print("❌ No credentials configured!")
         return 1
 
@@ -179,21 +177,24 @@ def main():
             print_portfolio_group(group, optimizer, args.budget)
 
         # Summary
-        print(f"\n{'=' * 100}")
-        print(f"💼 PORTFOLIO SUMMARY")
-        print(f"{'=' * 100}")
+        lines = []
+        lines.append(f"\n{'=' * 100}")
+        lines.append(f"💼 PORTFOLIO SUMMARY")
+        lines.append(f"{'=' * 100}")
 
         total_allocation = sum(g.recommended_allocation for g in portfolio_groups) * args.bankroll
         total_expected = sum(g.expected_return for g in portfolio_groups)
         avg_sharpe = sum(g.sharpe_ratio for g in portfolio_groups) / len(portfolio_groups)
 
-        print(f"\nTotal Recommended Allocation: ${total_allocation:.2f}")
-        print(f"Total Expected Return: ${total_expected:+,.2f}")
-        print(f"Average Sharpe Ratio: {avg_sharpe:.2f}")
+        lines.append(f"\nTotal Recommended Allocation: ${total_allocation:.2f}")
+        lines.append(f"Total Expected Return: ${total_expected:+,.2f}")
+        lines.append(f"Average Sharpe Ratio: {avg_sharpe:.2f}")
 
-        print(f"\n🎯 TOP 3 GROUPS BY SHARPE RATIO:")
+        lines.append(f"\n🎯 TOP 3 GROUPS BY SHARPE RATIO:")
         for i, group in enumerate(portfolio_groups[:3], 1):
-            print(f"  {i}. {group.location} {group.metric} on {group.date.strftime('%b %d')}: Sharpe {group.sharpe_ratio:.2f}")
+            lines.append(f"  {i}. {group.location} {group.metric} on {group.date.strftime('%b %d')}: Sharpe {group.sharpe_ratio:.2f}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error: {e}")
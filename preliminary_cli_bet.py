@@ -15,20 +15,23 @@ Strategy:
 Usage:
     python preliminary_cli_bet.py               # Monitor Denver
     python preliminary_cli_bet.py --station KMIA  # Monitor Miami
+    python preliminary_cli_bet.py --station KDEN KMIA KCYS  # Monitor several stations at once
     python preliminary_cli_bet.py --bet-size 10  # Custom bet size
 """
 
-import os
 import sys
-import time
+import asyncio
 import logging
 import argparse
 import re
+from collections import defaultdict
 from datetime import datetime, date
 from dotenv import load_dotenv
 import pytz
 
 from scanner import KalshiClient, NWSAdapter, MarketParser
+from scanner.auth import CredentialsError, get_auth_kwargs
+from scanner.cache import default_cache_dir
 
 
 # Configure logging
@@ -39,6 +42,44 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Kalshi series and local timezone for each supported station
+STATION_TO_SERIES = {
+    "KDEN": "KXLOWTDEN",
+    "KMIA": "KXLOWTMIA",
+    "KCYS": "KXLOWTCYS"
+}
+
+STATION_TO_TZ = {
+    "KDEN": "America/Denver",
+    "KMIA": "America/New_York",
+    "KCYS": "America/Denver"
+}
+
+# Preliminary CLI reports are usually issued around 7:30 AM local time; poll
+# quickly within this many minutes of it, since NWS offers no push notification
+PUBLICATION_TIME = (7, 30)
+PUBLICATION_WINDOW_MINUTES = 30
+
+# Orders in flight at once when orders go out individually, kept low for Kalshi rate limits
+MAX_CONCURRENT_ORDERS = 5
+
+
+# Does the preliminary value satisfy the market? Keyed by comparison
+_COMPARISON_TESTS = {
+    "between": lambda value, low, high: low <= value <= high,
+    "above": lambda value, low, high: value >= low,
+    "at least": lambda value, low, high: value >= low,
+    "below": lambda value, low, high: value <= low,
+    "at most": lambda value, low, high: value <= low,
+}
+
+# (metric, comparison) -> (index into (prelim_min, prelim_max), test)
+ALIGNMENT_RULES = {
+    (metric, comparison): (value_index, test)
+    for metric, value_index in (("minimum", 0), ("maximum", 1))
+    for comparison, test in _COMPARISON_TESTS.items()
+}
+
 
 class PreliminaryCliScanner:
     """Scanner that bets based on preliminary Climate Reports"""
@@ -69,6 +110,10 @@ class PreliminaryCliScanner:
         self.parser = MarketParser()
         self.logger = logging.getLogger(__name__)
 
+        # Resolve the station's timezone once rather than on every monitor start
+        self.tz_name = STATION_TO_TZ.get(station_id, "America/Denver")
+        self.tz = pytz.timezone(self.tz_name)
+
         # Track which dates we've already bet on
         self.processed_dates = set()
 
@@ -101,33 +146,15 @@ class PreliminaryCliScanner:
         Returns:
             List of (market, side, confidence) tuples
         """
-        # Map station ID to series ticker
-        station_to_series = {
-            "KDEN": "KXLOWTDEN",
-            "KMIA": "KXLOWTMIA",
-            "KCYS": "KXLOWTCYS"
-        }
-
-        series_ticker = station_to_series.get(self.station_id)
+        series_ticker = STATION_TO_SERIES.get(self.station_id)
         if not series_ticker:
             self.logger.warning(f"No series mapping for station {self.station_id}")
             return []
 
-        # Get all open markets for this series
-        markets = self.kalshi.get_markets_for_series(series_ticker, status="open")
-
         matching_bets = []
 
-        for market in markets:
-            parsed = self.parser.parse(market["title"], market["ticker"])
-
-            if not parsed.is_parseable:
-                continue
-
-            # Only bet on markets for the target date
-            if parsed.date != target_date:
-                continue
-
+        # Only bet on markets for the target date
+        for market, parsed in self._markets_by_date(series_ticker).get(target_date, []):
             # Determine if market aligns with preliminary
             side, confidence = self._check_market_alignment(
                 parsed,
@@ -140,6 +167,25 @@ class PreliminaryCliScanner:
 
         return matching_bets
 
+    def _markets_by_date(self, series_ticker: str) -> dict:
+        """
+        Index a series' open markets by their parsed market date
+
+        Args:
+            series_ticker: Series ticker (e.g., KXLOWTDEN)
+
+        Returns:
+            Dict of date -> list of (market, parsed) tuples; unparseable markets are dropped
+        """
+        index = defaultdict(list)
+
+        for market in self.kalshi.get_markets_for_series(series_ticker, status="open"):
+            parsed = self.parser.parse(market["title"], market["ticker"])
+            if parsed.is_parseable:
+                index[parsed.date].append((market, parsed))
+
+        return index
+
     def _check_market_alignment(
         self,
         parsed,
@@ -152,58 +198,17 @@ class PreliminaryCliScanner:
         Returns:
             (side, confidence) tuple where side is "yes"/"no" or None
         """
-        metric = parsed.metric
-        comparison = parsed.comparison
-        threshold = parsed.threshold
-        threshold_high = parsed.threshold_high
-
-        # MINIMUM MARKETS
-        if metric == "minimum":
-            if comparison == "between":
-                # Range market: does prelim_min fall in range?
-                if threshold <= prelim_min <= threshold_high:
-                    return ("yes", 0.95)  # Prelim shows temp IN range
-                else:
-                    return ("no", 0.95)   # Prelim shows temp OUTSIDE range
-
-            elif comparison in ["above", "at least"]:
-                # Will min be >= threshold?
-                if prelim_min >= threshold:
-                    return ("yes", 0.95)
-                else:
-                    return ("no", 0.95)
-
-            elif comparison in ["below", "at most"]:
-                # Will min be <= threshold?
-                if prelim_min <= threshold:
-                    return ("yes", 0.95)
-                else:
-                    return ("no", 0.95)
-
-        # MAXIMUM MARKETS
-        elif metric == "maximum":
-            if comparison == "between":
-                # Range market: does prelim_max fall in range?
-                if threshold <= prelim_max <= threshold_high:
-                    return ("yes", 0.95)  # Prelim shows temp IN range
-                else:
-                    return ("no", 0.95)   # Prelim shows temp OUTSIDE range
-
-            elif comparison in ["above", "at least"]:
-                # Will max be >= threshold?
-                if prelim_max >= threshold:
-                    return ("yes", 0.95)
-                else:
-                    return ("no", 0.95)
-
-            elif comparison in ["below", "at most"]:
-                # Will max be <= threshold?
-                if prelim_max <= threshold:
-                    return ("yes", 0.95)
-                else:
-                    return ("no", 0.95)
-
-        return (None, 0.0)
+        rule = ALIGNMENT_RULES.get((parsed.metric, parsed.comparison))
+        if rule is None:
+            return (None, 0.0)
+
+        # Minimum markets are judged on prelim_min, maximum markets on prelim_max
+        value_index, test = rule
+        value = (prelim_min, prelim_max)[value_index]
+
+        if test(value, parsed.threshold, parsed.threshold_high):
+            return ("yes", 0.95)
+        return ("no", 0.95)
 
     def place_bet(self, market: dict, side: str, confidence: float) -> dict:
         """
@@ -217,6 +222,19 @@ class PreliminaryCliScanner:
         Returns:
             Order confirmation
         """
+        return self.kalshi.place_order(**self._bet_order(market, side))
+
+    def _bet_order(self, market: dict, side: str) -> dict:
+        """
+        Size a bet and build its place_order arguments
+
+        Args:
+            market: Market dictionary
+            side: "yes" or "no"
+
+        Returns:
+            Keyword arguments for KalshiClient.place_order
+        """
         ticker = market["ticker"]
 
         # Calculate number of contracts based on bet size
@@ -231,15 +249,13 @@ class PreliminaryCliScanner:
 
         self.logger.info(f"Placing bet: {ticker} {side.upper()} x{count} @ ${price_dollars:.2f}")
 
-        order = self.kalshi.place_order(
-            ticker=ticker,
-            side=side,
-            action="buy",
-            count=count,
-            order_type="market"
-        )
-
-        return order
+        return {
+            "ticker": ticker,
+            "side": side,
+            "action": "buy",
+            "count": count,
+            "order_type": "market"
+        }
 
     def run_once(self, target_date: str) -> int:
         """
@@ -281,7 +297,7 @@ class PreliminaryCliScanner:
             self.logger.info(f"   Maximum: {prelim_max}°F at {preliminary.get('max_time', 'unknown')}")
 
         # Find matching markets
-        target_date_obj = datetime.strptime(target_date, "%Y-%m-%d").date()
+        target_date_obj = date.fromisoformat(target_date)
         matching_bets = self.find_matching_markets(prelim_min or 999, prelim_max or 999, target_date_obj)
 
         if not matching_bets:
@@ -293,15 +309,23 @@ class PreliminaryCliScanner:
         for i, (market, side, confidence) in enumerate(matching_bets, 1):
             self.logger.info(f"  {i}. {market['ticker']} - {side.upper()} ({confidence:.1%} confidence)")
 
-        # Place bets
+        # Place all bets together so slow round-trips don't delay later orders
+        orders = [self._bet_order(market, side) for market, side, _ in matching_bets]
+        try:
+            results = self.kalshi.place_orders_batch(orders, max_workers=MAX_CONCURRENT_ORDERS)
+        except Exception as e:
+            # Only raised before any order was placed; later batch failures come back per order
+            results = [{"error": str(e)} for _ in orders]
+
         successful_bets = 0
-        for market, side, confidence in matching_bets:
-            try:
-                order = self.place_bet(market, side, confidence)
-                self.logger.info(f"✅ Bet placed: {market['ticker']} {side.upper()} - Order ID: {order.get('order_id')}")
-                successful_bets += 1
-            except Exception as e:
-                self.logger.error(f"❌ Failed to place bet on {market['ticker']}: {e}")
+        for (market, side, confidence), result in zip(matching_bets, results):
+            if "error" in result:
+                self.logger.error(f"❌ Failed to place bet on {market['ticker']}: {result['error']}")
+                continue
+
+            order = result["order"]
+            self.logger.info(f"✅ Bet placed: {market['ticker']} {side.upper()} - Order ID: {order.get('order_id')}")
+            successful_bets += 1
 
         self.logger.info(f"\n✅ Placed {successful_bets}/{len(matching_bets)} bets for {target_date}")
 
@@ -310,35 +334,38 @@ class PreliminaryCliScanner:
 
         return successful_bets
 
-    def monitor(self, start_hour: int = 7, end_hour: int = 9, check_interval_minutes: int = 5):
+    async def monitor(
+        self,
+        start_hour: int = 7,
+        end_hour: int = 9,
+        check_interval_minutes: int = 5,
+        fast_interval_seconds: int = 30
+    ):
         """
         Monitor for preliminary CLI and auto-bet
 
+        Runs as a coroutine so several stations can be monitored from one event loop.
+
         Args:
             start_hour: Start monitoring at this hour (default: 7 AM)
             end_hour: Stop monitoring at this hour (default: 9 AM)
             check_interval_minutes: Check every N minutes (default: 5)
+            fast_interval_seconds: Check interval near the expected publication
+                time, until today's report is processed (default: 30s)
         """
-        # Get timezone for this station
-        station_to_tz = {
-            "KDEN": "America/Denver",
-            "KMIA": "America/New_York",
-            "KCYS": "America/Denver"
-        }
-
-        tz_str = station_to_tz.get(self.station_id, "America/Denver")
-        tz = pytz.timezone(tz_str)
-
         self.logger.info("=" * 80)
         self.logger.info(f"PRELIMINARY CLI MONITOR - {self.station_id}")
         self.logger.info("=" * 80)
-        self.logger.info(f"Monitoring window: {start_hour:02d}:00 - {end_hour:02d}:00 {tz_str}")
-        self.logger.info(f"Check interval: {check_interval_minutes} minutes")
+        self.logger.info(f"Monitoring window: {start_hour:02d}:00 - {end_hour:02d}:00 {self.tz_name}")
+        self.logger.info(
+            f"Check interval: {check_interval_minutes} minutes "
+            f"({fast_interval_seconds}s around {PUBLICATION_TIME[0]}:{PUBLICATION_TIME[1]:02d})"
+        )
         self.logger.info(f"Bet size: ${self.bet_size_dollars:.2f} per market")
         self.logger.info("=" * 80)
 
         while True:
-            current_time = datetime.now(tz)
+            current_time = datetime.now(self.tz)
             current_hour = current_time.hour
 
             # Only check during monitoring window
@@ -347,7 +374,8 @@ class PreliminaryCliScanner:
                 today = current_time.date().isoformat()
 
                 try:
-                    bets_placed = self.run_once(today)
+                    # run_once does blocking HTTP, so keep it off the event loop
+                    bets_placed = await asyncio.to_thread(self.run_once, today)
 
                     if bets_placed > 0:
                         self.logger.info(f"\n🎯 Successfully placed {bets_placed} bets!")
@@ -361,9 +389,34 @@ class PreliminaryCliScanner:
             else:
                 self.logger.info(f"Outside monitoring window (current: {current_hour:02d}:00)")
 
-            # Sleep until next check
-            self.logger.info(f"Sleeping for {check_interval_minutes} minutes...")
-            time.sleep(check_interval_minutes * 60)
+            # Sleep until next check, polling faster while today's report is due
+            report_due = current_time.date().isoformat() not in self.processed_dates
+            if report_due and self._near_publication(current_time):
+                interval_seconds = fast_interval_seconds
+            else:
+                interval_seconds = check_interval_minutes * 60
+
+            self.logger.info(f"Sleeping for {interval_seconds}s...")
+            await asyncio.sleep(interval_seconds)
+
+    def _near_publication(self, current_time: datetime) -> bool:
+        """Whether local time is within PUBLICATION_WINDOW_MINUTES of the usual CLI issue time"""
+        publication = current_time.replace(
+            hour=PUBLICATION_TIME[0], minute=PUBLICATION_TIME[1], second=0, microsecond=0
+        )
+        minutes_away = abs((current_time - publication).total_seconds()) / 60
+        return minutes_away <= PUBLICATION_WINDOW_MINUTES
+
+
+async def monitor_stations(scanners: list, **monitor_kwargs):
+    """
+    Monitor several stations concurrently in one event loop
+
+    Args:
+        scanners: PreliminaryCliScanner instances, one per station
+        **monitor_kwargs: Passed through to each scanner's monitor()
+    """
+    await asyncio.gather(*(scanner.monitor(**monitor_kwargs) for scanner in scanners))
 
 
 def main():
@@ -372,8 +425,9 @@ def main():
     )
     parser.add_argument(
         "--station",
-        default="KDEN",
-        help="Weather station ID (default: KDEN for Denver)"
+        nargs="+",
+        default=["KDEN"],
+        help="Weather station ID(s) (default: KDEN for Denver)"
     )
     parser.add_argument(
         "--bet-size",
@@ -410,45 +464,43 @@ def main():
     load_dotenv()
 
     # Get credentials
-    api_key_id = os.getenv("KALSHI_API_KEY_ID")
-    private_key_path = os.getenv("KALSHI_PRIVATE_KEY_PATH", "kalshi_api_private_key.txt")
-    email = os.getenv("KALSHI_EMAIL")
-    password = os.getenv("KALSHI_PASSWORD")
-
-    if api_key_id and os.path.exists(private_key_path):
-        auth_kwargs = {"api_key_id": api_key_id, "private_key_path": private_key_path}
-    elif email and password:
-        auth_kwargs = {"email": email, "password": password}
-    else:
+    try:
+        auth_kwargs = get_auth_kwargs()
+    except CredentialsError:
         logger.error("❌ No credentials configured!")
         return 1
 
     try:
         # Initialize clients
-        kalshi_client = KalshiClient(**auth_kwargs)
-        nws_adapter = NWSAdapter()
-
-        # Create scanner
-        scanner = PreliminaryCliScanner(
-            kalshi_client=kalshi_client,
-            nws_adapter=nws_adapter,
-            station_id=args.station,
-            bet_size_dollars=args.bet_size
-        )
+        cache_dir = str(default_cache_dir())
+        kalshi_client = KalshiClient(**auth_kwargs, cache_dir=cache_dir)
+        nws_adapter = NWSAdapter(cache_dir=cache_dir)
+
+        # Create one scanner per station, sharing the clients
+        scanners = [
+            PreliminaryCliScanner(
+                kalshi_client=kalshi_client,
+                nws_adapter=nws_adapter,
+                station_id=station_id,
+                bet_size_dollars=args.bet_size
+            )
+            for station_id in args.station
+        ]
 
         if args.once:
             # Run once and exit
             today = datetime.now().date().isoformat()
-            bets_placed = scanner.run_once(today)
+            bets_placed = sum(scanner.run_once(today) for scanner in scanners)
             logger.info(f"\nPlaced {bets_placed} bets. Exiting.")
             return 0
         else:
-            # Monitor continuously
-            scanner.monitor(
+            # Monitor all stations concurrently
+            asyncio.run(monitor_stations(
+                scanners,
                 start_hour=args.start_hour,
                 end_hour=args.end_hour,
                 check_interval_minutes=args.interval
-            )
+            ))
 
     except KeyboardInterrupt:
         logger.info("\n\n⚠️  Monitoring stopped by user")
@@ -1,28 +1,20 @@
 #!/usr/bin/env python3
 """Quick test to check what markets we can access"""
 
-import os
 import logging
 from dotenv import load_dotenv
 from scanner import KalshiClient
+from scanner.auth import CredentialsError, get_auth_kwargs
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-# Get credentials
-api_key_id = os.getenv("KALSHI_API_KEY_ID")
-private_key_path = os.getenv("KALSHI_PRIVATE_KEY_PATH", "kalshi_api_private_key.txt")
-email = os.getenv("KALSHI_EMAIL")
-password = os.getenv("KALSHI_PASSWORD")
-
 # Initialize client
-if api_key_id and os.path.exists(private_key_path):
-    client = KalshiClient(api_key_id=api_key_id, private_key_path=private_key_path)
-elif email and password:
-    client = KalshiClient(email=email, password=password)
-else:
+try:
+    client = KalshiClient(**get_auth_kwargs())
+except CredentialsError:
     print("No credentials found!")
     exit(1)
 
@@ -31,10 +23,21 @@ print("\n" + "="*60)
 print("Testing specific market tickers:")
 print("="*60)
 
-for ticker in ["KXLOWTMIA-26JAN16", "KXLOWTDEN-26JAN16"]:
+tickers = ["KXLOWTMIA-26JAN16", "KXLOWTDEN-26JAN16"]
+
+# Fetch all tickers in one request
+try:
+    markets = client.get_markets_batch(tickers)
+except Exception as e:
+    print(f"\nERROR fetching markets: {e}")
+    markets = {}
+
+for ticker in tickers:
     try:
         print(f"\n{ticker}:")
-        market = client.get_market(ticker)
+        if ticker not in markets:
+            raise ValueError("market not found")
+        market = markets[ticker]
         print(f"  Title: {market.get('title')}")
         print(f"  Status: {market.get('status')}")
         print(f"  YES: {market.get('yes_bid')}/{market.get('yes_ask')}")
@@ -50,8 +53,15 @@ print("="*60)
 promo_markets = client.get_promo_markets()
 print(f"Total promo markets: {len(promo_markets)}")
 
-# Look for temperature/weather
-weather = [m for m in promo_markets if 'temp' in m['title'].lower() or 'weather' in m['title'].lower()]
+# Bucket weather and Denver/Miami markets in one pass over the list
+weather, denver_miami = [], []
+for m in promo_markets:
+    title = m['title'].lower()
+    if 'temp' in title or 'weather' in title:
+        weather.append(m)
+    if 'denver' in title or 'miami' in title:
+        denver_miami.append(m)
+
 print(f"Weather-related promo markets: {len(weather)}")
 
 if weather:
@@ -60,7 +70,6 @@ if weather:
         print(f"  {m['ticker']}: {m['title'][:70]}")
 
 # Look for Denver/Miami
-denver_miami = [m for m in promo_markets if 'denver' in m['title'].lower() or 'miami' in m['title'].lower()]
 print(f"\nDenver/Miami promo markets: {len(denver_miami)}")
 
 if denver_miami:
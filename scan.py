@@ -19,6 +19,7 @@ import sys
 import logging
 from dotenv import load_dotenv
 from scanner import KalshiWeatherScanner
+from scanner.auth import CredentialsError, get_auth_kwargs
 
 
 def setup_logging():
@@ -47,25 +48,13 @@ def main():
     logger.info("=" * 80)
 
     # Get credentials (API key preferred)
-    api_key_id = os.getenv("KALSHI_API_KEY_ID")
-    private_key_path = os.getenv("KALSHI_PRIVATE_KEY_PATH", "kalshi_api_private_key.txt")
-    email = os.getenv("KALSHI_EMAIL")
-    password = os.getenv("KALSHI_PASSWORD")
-
-    # Determine authentication method
-    if api_key_id and os.path.exists(private_key_path):
-        logger.info("Using API key authentication")
-        auth_kwargs = {
-            "api_key_id": api_key_id,
-            "private_key_path": private_key_path
-        }
-    elif email and password:
-        logger.info("Using email/password authentication")
-        auth_kwargs = {
-            "email": email,
-            "password": password
-        }
-    else:
+    try:
+        auth_kwargs = get_auth_kwargs()
+        if "api_key_id" in auth_kwargs:
+            logger.info("Using API key authentication")
+        else:
+            logger.info("Using email/password authentication")
+    except CredentialsError:
         logger.error("No valid credentials found!")
         logger.error("Please configure .env with either:")
         logger.error("  - KALSHI_API_KEY_ID + kalshi_api_private_key.txt (recommended)")
@@ -9,8 +9,21 @@ Usage: python scan_all_edges.py KXLOWTDEN KXLOWTMIA
 import os
 import sys
 import logging
+from bisect import bisect_right
 from dotenv import load_dotenv
 from scanner import KalshiWeatherScanner
+from scanner.auth import CredentialsError, get_auth_kwargs
+
+# Edge labels by lower bound: an edge gets the label of the highest bound it reaches
+EDGE_BOUNDS = [0, 0.05, 0.10, 0.20, 0.30]
+EDGE_CATEGORIES = [
+    "❌ NEGATIVE EDGE",
+    "⚠ TINY EDGE",
+    "~ SMALL EDGE",
+    "✓ GOOD EDGE",
+    "⭐ STRONG EDGE",
+    "🔥 HUGE EDGE",
+]
 
 def setup_logging():
     """Configure logging"""
@@ -37,16 +50,9 @@ def main():
     print()
 
     # Get credentials
-    api_key_id = os.getenv("KALSHI_API_KEY_ID")
-    private_key_path = os.getenv("KALSHI_PRIVATE_KEY_PATH", "kalshi_api_private_key.txt")
-    email = os.getenv("KALSHI_EMAIL")
-    password = os.getenv("KALSHI_PASSWORD")
-
-    if api_key_id and os.path.exists(private_key_path):
-        auth_kwargs = {"api_key_id": api_key_id, "private_key_path": private_key_path}
-    elif email and password:
-        auth_kwargs = {"email": email, "password": password}
-    else:
+    try:
+        auth_kwargs = get_auth_kwargs()
+    except CredentialsError:
         print("❌ No credentials configured!")
         return 1
 
@@ -62,6 +68,19 @@ def main():
         (0.20, "Very Conservative (20%+ edge)"),
     ]
 
+    # The recommended side depends on the threshold (YES wins whenever it clears it), so
+    # each threshold gets its own scan; one scanner keeps the HTTP caches warm between them
+    try:
+        scanner = KalshiWeatherScanner(
+            **auth_kwargs,
+            bankroll=bankroll,
+            kelly_fraction=kelly_fraction,
+            min_edge_threshold=thresholds[0][0]
+        )
+    except Exception as e:
+        print(f"\n❌ Error initializing scanner: {e}\n")
+        return 1
+
     all_results = {}
 
     for threshold, label in thresholds:
@@ -70,57 +89,40 @@ def main():
         print('=' * 100)
 
         try:
-            # Initialize scanner with this threshold
-            scanner = KalshiWeatherScanner(
-                **auth_kwargs,
-                bankroll=bankroll,
-                kelly_fraction=kelly_fraction,
-                min_edge_threshold=threshold
-            )
-
-            # Scan (suppress logs)
+            scanner.detector.min_edge_threshold = threshold
             opportunities = scanner.scan(series_tickers=series_tickers)
-            all_results[threshold] = opportunities
-
-            if opportunities:
-                # Sort by edge
-                sorted_opps = sorted(opportunities, key=lambda x: x.edge, reverse=True)
-
-                print(f"\n✅ Found {len(opportunities)} opportunities at {threshold:.0%} threshold\n")
-
-                # Show all opportunities
-                for i, opp in enumerate(sorted_opps, 1):
-                    # Categorize edge
-                    if opp.edge >= 0.30:
-                        category = "🔥 HUGE EDGE"
-                    elif opp.edge >= 0.20:
-                        category = "⭐ STRONG EDGE"
-                    elif opp.edge >= 0.10:
-                        category = "✓ GOOD EDGE"
-                    elif opp.edge >= 0.05:
-                        category = "~ SMALL EDGE"
-                    elif opp.edge >= 0:
-                        category = "⚠ TINY EDGE"
-                    else:
-                        category = "❌ NEGATIVE EDGE"
-
-                    print(f"{i:2d}. {category} | {opp.ticker}")
-                    print(f"    Market: {opp.title[:80]}")
-                    print(f"    NWS Forecast: min={opp.forecast_min:.1f}°F, max={opp.forecast_max:.1f}°F, avg={opp.forecast_avg:.1f}°F")
-                    print(f"    Our Probability: {opp.true_probability:.1%}")
-                    print(f"    Market Price: YES={opp.market_yes_price:.1%}, NO={opp.market_no_price:.1%}")
-                    print(f"    Edge: {opp.edge:+.1%} | Bet {opp.recommended_side} ${opp.recommended_bet_size:.2f}")
-                    print(f"    Reasoning: {opp.reasoning[:120]}")
-                    print(f"    Confidence: {opp.confidence:.0%} | Liquidity: ${opp.liquidity_pool_size:,.0f}")
-                    print()
-            else:
-                print(f"\n❌ No opportunities at {threshold:.0%} threshold")
-                print("All markets are efficiently priced or outside this threshold.\n")
-
         except Exception as e:
             print(f"\n❌ Error at threshold {threshold:.0%}: {e}\n")
             continue
 
+        opportunities = sorted(opportunities, key=lambda x: x.edge, reverse=True)
+        all_results[threshold] = opportunities
+
+        if opportunities:
+            # Collect the block and write it once, rather than ten print() calls per market
+            lines = [f"\n✅ Found {len(opportunities)} opportunities at {threshold:.0%} threshold\n"]
+
+            # Show all opportunities
+            for i, opp in enumerate(opportunities, 1):
+                category = EDGE_CATEGORIES[bisect_right(EDGE_BOUNDS, opp.edge)]
+
+                # One multi-line f-string per market (a single allocation) instead of nine
+                lines.append(
+                    f"{i:2d}. {category} | {opp.ticker}\n"
+                    f"    Market: {opp.title[:80]}\n"
+                    f"    NWS Forecast: min={opp.forecast_min:.1f}°F, max={opp.forecast_max:.1f}°F, avg={opp.forecast_avg:.1f}°F\n"
+                    f"    Our Probability: {opp.true_probability:.1%}\n"
+                    f"    Market Price: YES={opp.market_yes_price:.1%}, NO={opp.market_no_price:.1%}\n"
+                    f"    Edge: {opp.edge:+.1%} | Bet {opp.recommended_side} ${opp.recommended_bet_size:.2f}\n"
+                    f"    Reasoning: {opp.reasoning[:120]}\n"
+                    f"    Confidence: {opp.confidence:.0%} | Liquidity: ${opp.liquidity_pool_size:,.0f}\n"
+                )
+
+            sys.stdout.write("\n".join(lines) + "\n")
+        else:
+            print(f"\n❌ No opportunities at {threshold:.0%} threshold")
+            print("All markets are efficiently priced or outside this threshold.\n")
+
     # Summary comparison
     print("\n" + "=" * 100)
     print("SUMMARY - Opportunities by Threshold")
@@ -142,11 +144,10 @@ def main():
     print("pricing BETTER than our model. Could be noise, or market knows something we don't.\n")
 
     if 0.0 in all_results and all_results[0.0]:
-        longshots = [opp for opp in all_results[0.0] if opp.edge < 0.05]
-
-        if longshots:
-            sorted_longshots = sorted(longshots, key=lambda x: x.edge)
+        # Results are already sorted by edge, highest first; walk them from the bottom
+        sorted_longshots = [opp for opp in reversed(all_results[0.0]) if opp.edge < 0.05]
 
+        if sorted_longshots:
             for i, opp in enumerate(sorted_longshots[:10], 1):  # Top 10 worst
                 print(f"{i:2d}. {opp.ticker} | Edge: {opp.edge:+.1%}")
                 print(f"    Our prob: {opp.true_probability:.1%} vs Market: {opp.market_yes_price:.1%} YES / {opp.market_no_price:.1%} NO")
@@ -9,18 +9,24 @@ This script:
 - Works with ALL climate markets, not just Denver/Miami
 - Includes retry logic for API failures
 - Generates timestamped reports for each scan
+- Re-reads .env on SIGHUP without restarting
 - Optimized for timing advantages in overnight markets
 """
 
 import os
 import sys
 import time
+import signal
 import logging
-from datetime import datetime, time as dt_time
+from datetime import datetime, timedelta, time as dt_time
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
-from scanner import KalshiWeatherScanner
+from scanner import KalshiClient, KalshiWeatherScanner
+from scanner.auth import CredentialsError, get_auth_kwargs, reload_auth_kwargs
+from scanner.mispricing_detector import step_probability
+from scanner.report_generator import write_atomic
 
 
 # Configuration
@@ -30,6 +36,10 @@ END_HOUR = int(os.getenv("OVERNIGHT_END_HOUR", "8"))  # 8am
 REPORTS_DIR = Path(os.getenv("REPORTS_DIR", "./reports"))
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 60
+RELOAD_CHECK_SECONDS = 60  # How often a sleeping scanner checks for a SIGHUP reload
+
+# Set by the SIGHUP handler; the main loop re-reads .env at its next check
+_reload_requested = False
 
 
 # Setup logging
@@ -44,15 +54,115 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def is_overnight_hours() -> bool:
+def load_config() -> None:
+    """Read the scan schedule from the environment (called at startup and on SIGHUP)"""
+    global SCAN_INTERVAL_MINUTES, START_HOUR, END_HOUR
+    SCAN_INTERVAL_MINUTES = int(os.getenv("SCAN_INTERVAL_MINUTES", "120"))
+    START_HOUR = int(os.getenv("OVERNIGHT_START_HOUR", "20"))
+    END_HOUR = int(os.getenv("OVERNIGHT_END_HOUR", "8"))
+
+
+def _request_reload(signum, frame) -> None:
+    """SIGHUP handler: defer the reload to the main loop rather than doing I/O here"""
+    global _reload_requested
+    _reload_requested = True
+
+
+def reload_config_if_requested(scanner: Optional[KalshiWeatherScanner] = None) -> None:
+    """
+    Re-read .env if a SIGHUP arrived, keeping the running scanner and its caches
+
+    Args:
+        scanner: Running scanner, whose Kalshi client is rebuilt if the
+                 credentials changed (e.g. a rotated API key)
+    """
+    global _reload_requested
+    if not _reload_requested:
+        return
+
+    _reload_requested = False
+    load_dotenv(override=True)
+    if scanner is not None:
+        reload_credentials(scanner)
+    try:
+        load_config()
+    except ValueError as e:
+        logger.error(f"Ignoring invalid configuration on reload: {e}")
+        return
+
+    logger.info(
+        f"Reloaded configuration: scan interval {SCAN_INTERVAL_MINUTES} minutes, "
+        f"overnight hours {START_HOUR}:00 - {END_HOUR}:00"
+    )
+
+
+def reload_credentials(scanner: KalshiWeatherScanner) -> None:
+    """
+    Swap in a new Kalshi client if the credentials in the environment changed
+
+    The old client is kept if the new credentials are missing or can't be
+    loaded, so a bad edit to .env doesn't stop the scanner.
+
+    Args:
+        scanner: Running scanner whose client should use the new credentials
+    """
+    try:
+        old_kwargs = get_auth_kwargs()
+    except CredentialsError:
+        old_kwargs = None
+
+    try:
+        new_kwargs = reload_auth_kwargs()
+    except CredentialsError as e:
+        logger.error(f"Keeping current Kalshi credentials: {e}")
+        return
+
+    if new_kwargs == old_kwargs:
+        return
+
+    old_cache = scanner.kalshi.cache
+    try:
+        scanner.kalshi = KalshiClient(
+            **new_kwargs,
+            cache_dir=str(old_cache.cache_dir) if old_cache else None
+        )
+    except Exception as e:
+        logger.error(f"Keeping current Kalshi client, new credentials failed: {e}")
+        return
+
+    logger.info(f"Reloaded Kalshi credentials ({scanner.kalshi.auth_method})")
+
+
+def wait_for_next_scan(last_scan: float, scanner: Optional[KalshiWeatherScanner] = None) -> None:
+    """
+    Sleep until SCAN_INTERVAL_MINUTES after the last scan started
+
+    Sleeps in short slices so an interval changed by SIGHUP applies to the
+    current wait instead of the one after it.
+
+    Args:
+        last_scan: Timestamp the last scan started at
+        scanner: Running scanner, passed on to reload_config_if_requested
+    """
+    while True:
+        reload_config_if_requested(scanner)
+        remaining = last_scan + SCAN_INTERVAL_MINUTES * 60 - time.time()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, RELOAD_CHECK_SECONDS))
+
+
+def is_overnight_hours(now: Optional[datetime] = None) -> bool:
     """
     Check if current time is within overnight scanning hours
 
+    Args:
+        now: Local time to check (default: current time)
+
     Returns:
         True if within overnight hours
     """
-    now = datetime.now()
-    current_hour = now.hour
+    current_hour = (now or datetime.now()).hour
 
     # Handle overnight range that crosses midnight
     if START_HOUR > END_HOUR:
@@ -63,6 +173,45 @@ def is_overnight_hours() -> bool:
         return START_HOUR <= current_hour < END_HOUR
 
 
+def next_overnight_start(now: datetime) -> datetime:
+    """
+    Next START_HOUR:00 local time after now
+
+    Args:
+        now: Current local time
+
+    Returns:
+        Naive local datetime of the next overnight start
+    """
+    wake_time = now.replace(hour=START_HOUR, minute=0, second=0, microsecond=0)
+    if wake_time <= now:
+        wake_time += timedelta(days=1)
+    return wake_time
+
+
+def wait_until_overnight_start(scanner: Optional[KalshiWeatherScanner] = None) -> None:
+    """
+    Sleep until the next START_HOUR:00 local time
+
+    Sleeps in short slices and recomputes the wake time after each one, so a
+    SIGHUP that changes the overnight hours takes effect during the day instead
+    of after the old wake time.
+
+    Args:
+        scanner: Running scanner, passed on to reload_config_if_requested
+    """
+    while True:
+        reload_config_if_requested(scanner)
+        if is_overnight_hours():
+            return
+        # Subtract timestamps rather than naive datetimes so a DST change in
+        # between doesn't shift the wake-up by an hour
+        remaining = next_overnight_start(datetime.now()).timestamp() - time.time()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, RELOAD_CHECK_SECONDS))
+
+
 def run_single_scan(scanner: KalshiWeatherScanner) -> int:
     """
     Run a single scan with retry logic
@@ -112,8 +261,7 @@ def save_timestamped_report(scanner: KalshiWeatherScanner, opportunities: list)
 
     report = scanner.reporter.generate_daily_report(opportunities)
 
-    with open(report_path, 'w') as f:
-        f.write(report)
+    write_atomic(str(report_path), report)
 
     logger.info(f"Report saved to {report_path}")
     return report_path
@@ -123,6 +271,11 @@ def main():
     """Main overnight scanning loop"""
     # Load environment variables
     load_dotenv()
+    load_config()
+
+    # Re-read .env on SIGHUP without restarting (and losing in-memory caches)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, _request_reload)
 
     # Create reports directory
     REPORTS_DIR.mkdir(exist_ok=True)
@@ -138,33 +291,22 @@ def main():
 
     # Initialize scanner
     try:
-        # Check for API key credentials (preferred method)
-        api_key_id = os.getenv("KALSHI_API_KEY_ID")
-        private_key_path = os.getenv("KALSHI_PRIVATE_KEY_PATH", "kalshi_api_private_key.txt")
-
-        # Fallback to email/password
-        email = os.getenv("KALSHI_EMAIL")
-        password = os.getenv("KALSHI_PASSWORD")
-
-        if api_key_id and os.path.exists(private_key_path):
-            logger.info("Authenticating with API key...")
-            scanner = KalshiWeatherScanner(
-                api_key_id=api_key_id,
-                private_key_path=private_key_path
-            )
-        elif email and password:
-            logger.info("Authenticating with email/password...")
-            scanner = KalshiWeatherScanner(
-                email=email,
-                password=password
-            )
-        else:
+        # API key credentials preferred, falling back to email/password
+        try:
+            auth_kwargs = get_auth_kwargs()
+        except CredentialsError:
             logger.error("No Kalshi credentials found!")
             logger.error("Set either:")
             logger.error("  - KALSHI_API_KEY_ID + KALSHI_PRIVATE_KEY_PATH")
             logger.error("  - KALSHI_EMAIL + KALSHI_PASSWORD")
             return 1
 
+        if "api_key_id" in auth_kwargs:
+            logger.info("Authenticating with API key...")
+        else:
+            logger.info("Authenticating with email/password...")
+        scanner = KalshiWeatherScanner(**auth_kwargs)
+
         logger.info(f"Authenticated using {scanner.kalshi.auth_method}")
 
     except Exception as e:
@@ -177,25 +319,18 @@ def main():
 
     try:
         while True:
+            reload_config_if_requested(scanner)
             now = datetime.now()
 
             # Check if we're in overnight hours
-            if not is_overnight_hours():
+            if not is_overnight_hours(now):
                 logger.info(f"Outside overnight hours (current: {now.strftime('%H:%M')})")
                 logger.info(f"Waiting until {START_HOUR}:00 to start scanning...")
 
-                # Calculate sleep time until start hour
-                if now.hour < START_HOUR:
-                    # Same day
-                    wake_time = now.replace(hour=START_HOUR, minute=0, second=0, microsecond=0)
-                else:
-                    # Next day
-                    from datetime import timedelta
-                    wake_time = (now + timedelta(days=1)).replace(hour=START_HOUR, minute=0, second=0, microsecond=0)
-
-                sleep_seconds = (wake_time - now).total_seconds()
+                wake_time = next_overnight_start(now)
+                sleep_seconds = max(0.0, wake_time.timestamp() - time.time())
                 logger.info(f"Sleeping for {sleep_seconds/3600:.1f} hours until {wake_time.strftime('%Y-%m-%d %H:%M')}")
-                time.sleep(sleep_seconds)
+                wait_until_overnight_start(scanner)
                 continue
 
             # Run scan
@@ -228,6 +363,8 @@ def main():
             # Summary
             logger.info(f"\nTotal scans: {scan_count}")
             logger.info(f"Total opportunities found: {total_opportunities}")
+            cache_info = step_probability.cache_info()
+            logger.info(f"Probability cache: {cache_info.hits} hits, {cache_info.misses} misses")
 
             # Calculate next scan time
             next_scan = now.timestamp() + (SCAN_INTERVAL_MINUTES * 60)
@@ -244,7 +381,7 @@ def main():
             logger.info("=" * 80)
 
             # Sleep until next scan
-            time.sleep(SCAN_INTERVAL_MINUTES * 60)
+            wait_for_next_scan(now.timestamp(), scanner)
 
     except KeyboardInterrupt:
         logger.info("\n\nReceived interrupt signal - shutting down gracefully")
@@ -9,9 +9,12 @@ Example:
 
 import os
 import sys
+import heapq
 import logging
 from dotenv import load_dotenv
 from scanner import KalshiWeatherScanner
+from scanner.auth import CredentialsError, get_auth_kwargs
+from scanner.report_generator import write_atomic
 
 def setup_logging():
     """Configure logging"""
@@ -46,16 +49,9 @@ def main():
     logger.info(f"Scanning series: {', '.join(series_tickers)}")
 
     # Get credentials
-    api_key_id = os.getenv("KALSHI_API_KEY_ID")
-    private_key_path = os.getenv("KALSHI_PRIVATE_KEY_PATH", "kalshi_api_private_key.txt")
-    email = os.getenv("KALSHI_EMAIL")
-    password = os.getenv("KALSHI_PASSWORD")
-
-    if api_key_id and os.path.exists(private_key_path):
-        auth_kwargs = {"api_key_id": api_key_id, "private_key_path": private_key_path}
-    elif email and password:
-        auth_kwargs = {"email": email, "password": password}
-    else:
+    try:
+        auth_kwargs = get_auth_kwargs()
+    except CredentialsError:
         logger.error("No credentials configured!")
         return 1
 
@@ -94,9 +90,9 @@ def main():
             logger.info("")
 
             # Show top opportunities
-            sorted_opps = sorted(opportunities, key=lambda x: x.edge, reverse=True)
+            sorted_opps = heapq.nlargest(5, opportunities, key=lambda x: x.edge)
             logger.info("Top opportunities:")
-            for i, opp in enumerate(sorted_opps[:5], 1):
+            for i, opp in enumerate(sorted_opps, 1):
                 logger.info(
                     f"  {i}. {opp.ticker}: {opp.edge:+.1%} edge, "
                     f"bet {opp.recommended_side} ${opp.recommended_bet_size:.2f}"
@@ -120,12 +116,10 @@ def main():
             csv_path = f"{output_dir}/kalshi_opportunities_{timestamp}.csv"
             current_path = f"{output_dir}/current.md"
 
-            with open(md_path, "w") as f:
-                f.write(report_md)
-            with open(csv_path, "w") as f:
-                f.write(report_csv)
-            with open(current_path, "w") as f:
-                f.write(report_md)
+            # Atomic writes: the overnight scanner may be reading current.md
+            write_atomic(md_path, report_md)
+            write_atomic(csv_path, report_csv)
+            write_atomic(current_path, report_md)
 
             logger.info(f"📊 Saved reports:")
             logger.info(f"   - {md_path}")
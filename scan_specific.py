@@ -9,6 +9,7 @@ import sys
 import logging
 from dotenv import load_dotenv
 from scanner import KalshiWeatherScanner
+from scanner.auth import CredentialsError, get_auth_kwargs
 
 def setup_logging():
     """Configure logging"""
@@ -40,16 +41,9 @@ def main():
     logger.info(f"Scanning specific tickers: {tickers}")
 
     # Get credentials
-    api_key_id = os.getenv("KALSHI_API_KEY_ID")
-    private_key_path = os.getenv("KALSHI_PRIVATE_KEY_PATH", "kalshi_api_private_key.txt")
-    email = os.getenv("KALSHI_EMAIL")
-    password = os.getenv("KALSHI_PASSWORD")
-
-    if api_key_id and os.path.exists(private_key_path):
-        auth_kwargs = {"api_key_id": api_key_id, "private_key_path": private_key_path}
-    elif email and password:
-        auth_kwargs = {"email": email, "password": password}
-    else:
+    try:
+        auth_kwargs = get_auth_kwargs()
+    except CredentialsError:
         logger.error("No credentials configured!")
         return 1
 
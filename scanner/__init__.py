@@ -1,15 +1,30 @@
 """
 Kalshi Weather Arbitrage Scanner
 Core components for identifying mispriced weather markets
+
+Public names are imported from their submodules on first access (PEP 562), so
+importing a light submodule such as scanner.market_parser or scanner.city_config
+does not pull in requests and cryptography via KalshiClient.
 """
 
-from .kalshi_client import KalshiClient
-from .nws_adapter import NWSAdapter
-from .market_parser import MarketParser, ParsedMarket
-from .mispricing_detector import MispricingDetector, Opportunity
-from .report_generator import ReportGenerator
-from .portfolio_optimizer import PortfolioOptimizer, PortfolioGroup, HedgingStrategy
-from .main import KalshiWeatherScanner
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'KalshiClient': '.kalshi_client',
+    'NWSAdapter': '.nws_adapter',
+    'MarketParser': '.market_parser',
+    'ParsedMarket': '.market_parser',
+    'MispricingDetector': '.mispricing_detector',
+    'Opportunity': '.mispricing_detector',
+    'ReportGenerator': '.report_generator',
+    'PortfolioOptimizer': '.portfolio_optimizer',
+    'PortfolioGroup': '.portfolio_optimizer',
+    'HedgingStrategy': '.portfolio_optimizer',
+    'KalshiWeatherScanner': '.main',
+    'CredentialsError': '.auth',
+    'get_auth_kwargs': '.auth',
+}
 
 __all__ = [
     'KalshiClient',
@@ -23,4 +38,21 @@ __all__ = [
     'PortfolioGroup',
     'HedgingStrategy',
     'KalshiWeatherScanner',
+    'CredentialsError',
+    'get_auth_kwargs',
 ]
+
+
+def __getattr__(name):
+    """Import a public name from its submodule the first time it is used"""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,74 @@
+"""
+Credential Loading
+Reads Kalshi credentials from the environment for the command-line scripts
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict
+
+
+DEFAULT_PRIVATE_KEY_PATH = "kalshi_api_private_key.txt"
+
+
+# Defined here rather than in kalshi_client so that importing the credential
+# helpers doesn't pull in requests and cryptography; kalshi_client re-exports it
+class AuthenticationError(Exception):
+    """Raised when authentication fails"""
+    pass
+
+
+class CredentialsError(AuthenticationError):
+    """Raised when no usable Kalshi credentials are configured"""
+    pass
+
+
+@lru_cache(maxsize=1)
+def _load_auth_kwargs() -> Dict[str, str]:
+    """Read credentials from the environment once per process"""
+    api_key_id = os.getenv("KALSHI_API_KEY_ID")
+    private_key_path = os.getenv("KALSHI_PRIVATE_KEY_PATH", DEFAULT_PRIVATE_KEY_PATH)
+    email = os.getenv("KALSHI_EMAIL")
+    password = os.getenv("KALSHI_PASSWORD")
+
+    if api_key_id and os.path.exists(private_key_path):
+        return {"api_key_id": api_key_id, "private_key_path": private_key_path}
+    if email and password:
+        return {"email": email, "password": password}
+
+    raise CredentialsError(
+        "No Kalshi credentials found. Set either "
+        "KALSHI_API_KEY_ID + KALSHI_PRIVATE_KEY_PATH or KALSHI_EMAIL + KALSHI_PASSWORD"
+    )
+
+
+def get_auth_kwargs() -> Dict[str, str]:
+    """
+    Build KalshiClient / KalshiWeatherScanner credential arguments from the environment
+
+    API key authentication is preferred when the key ID is set and the private
+    key file exists; otherwise email/password is used. The environment is read
+    once per process, so call this after load_dotenv().
+
+    Returns:
+        Keyword arguments for KalshiClient (api_key_id + private_key_path, or
+        email + password)
+
+    Raises:
+        CredentialsError: If neither set of credentials is configured
+    """
+    return dict(_load_auth_kwargs())
+
+
+def reload_auth_kwargs() -> Dict[str, str]:
+    """
+    Re-read credentials from the environment, e.g. after load_dotenv(override=True)
+
+    Returns:
+        The new get_auth_kwargs() result
+
+    Raises:
+        CredentialsError: If neither set of credentials is configured any more
+    """
+    _load_auth_kwargs.cache_clear()
+    return get_auth_kwargs()
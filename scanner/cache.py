@@ -0,0 +1,291 @@
+"""
+Response Cache
+File-backed TTL cache for API responses that are re-fetched across polls
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for a cache miss, so cached empty bodies ({} / []) still count as hits
+MISS = object()
+
+# Statuses for markets whose data can no longer change
+FINAL_MARKET_STATUSES = {"settled", "finalized"}
+
+# Default TTLs in seconds, overridable with KALSHI_CACHE_TTL_<NAME>
+DEFAULT_TTLS = {
+    "QUOTES": 30,  # Market prices
+    "METADATA": 86400,  # Series info, settled markets, NWS gridpoints
+    "FORECAST": 3600,  # NWS hourly forecasts (updated roughly hourly)
+    "OBSERVATIONS": 300,  # NWS station observations (new reports every 5-60 minutes)
+}
+
+
+def _loads(data: bytes) -> Any:
+    """Decode a cache entry, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(entry: Any) -> bytes:
+    """Encode a cache entry, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry)
+    return json.dumps(entry).encode("utf-8")
+
+
+class FileCache:
+    """
+    Stores JSON response bodies under <cache_dir>/<endpoint>/<md5(params)>.json
+
+    Each entry records when it was written and how long it stays fresh, so the
+    same directory can hold endpoints with different TTL policies.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], stale_ttl: float = 3600):
+        """
+        Args:
+            cache_dir: Directory to store cache entries in
+            stale_ttl: Most seconds past expiry that an entry may still be served
+                       when a refresh fails (stale-if-error); an entry is never
+                       served stale for longer than its own TTL, so a 30s quote
+                       is at most a minute old
+        """
+        self.cache_dir = Path(cache_dir)
+        self.stale_ttl = stale_ttl
+
+    def _path(self, endpoint: str, params: Dict) -> Path:
+        """Build the entry path for an endpoint and its parameters"""
+        key = json.dumps(params, sort_keys=True, default=str)
+        digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / endpoint / f"{digest}.json"
+
+    def get(self, endpoint: str, params: Dict, allow_stale: bool = False) -> Any:
+        """
+        Look up a cached response body
+
+        Args:
+            endpoint: Endpoint name the entry was stored under
+            params: Parameters the entry was stored under
+            allow_stale: Also return expired entries within the stale window
+
+        Returns:
+            Cached body, or MISS if there is no usable entry
+        """
+        path = self._path(endpoint, params)
+        try:
+            with open(path, "rb") as f:
+                entry = _loads(f.read())
+        except (OSError, ValueError):
+            return MISS
+
+        age = time.time() - entry["ts"]
+        max_age = entry["ttl"]
+        if allow_stale:
+            max_age += min(self.stale_ttl, entry["ttl"])
+        if age > max_age:
+            return MISS
+
+        return entry["body"]
+
+    def set(self, endpoint: str, params: Dict, body: Any, ttl: float) -> None:
+        """
+        Write a response body to the cache
+
+        Args:
+            endpoint: Endpoint name to store the entry under
+            params: Parameters to store the entry under
+            body: JSON-serializable response body
+            ttl: Seconds the entry stays fresh
+        """
+        path = self._path(endpoint, params)
+        entry = {"ts": time.time(), "ttl": ttl, "body": body}
+        # Write to a temp file and rename so concurrent readers never see a partial
+        # entry; the name is per thread since the scanners write from thread pools
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(entry))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write cache entry {path}: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def delete(self, endpoint: str, params: Dict) -> None:
+        """
+        Remove a cache entry so the next lookup refetches it
+
+        Args:
+            endpoint: Endpoint name the entry was stored under
+            params: Parameters the entry was stored under
+        """
+        try:
+            self._path(endpoint, params).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to delete cache entry for {endpoint}: {e}")
+
+    def clear(self, endpoint: str) -> None:
+        """
+        Remove every cache entry stored under an endpoint
+
+        Args:
+            endpoint: Endpoint name whose entries should be refetched
+        """
+        for path in (self.cache_dir / endpoint).glob("*.json"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to delete cache entry {path}: {e}")
+
+
+def cached(ttl: Union[float, Callable[[Any], Optional[float]]]):
+    """
+    Cache a client method's return value in the instance's FileCache
+
+    The instance must expose a `cache` attribute; when it is None the method
+    is called directly. On a fresh hit the wrapped method (and its HTTP request)
+    is skipped entirely. If a refresh fails, the last good copy is returned
+    while it is within the cache's stale window. A TTL policy that returns None
+    marks the result as a failed fetch: it is not stored (the previous entry is
+    kept) and the last good copy is returned in its place when there is one.
+
+    The wrapper gains an `invalidate(self, *args, **kwargs)` attribute that drops
+    the entry for those arguments, e.g. `KalshiClient.get_market.invalidate(client, ticker)`,
+    and an `invalidate_all(self)` attribute that drops every entry of the method.
+
+    Args:
+        ttl: Seconds a result stays fresh, or a callable mapping the result
+             to its TTL (for per-status policies), or to None to not store it
+    """
+    def decorator(method: Callable) -> Callable:
+        endpoint = method.__name__
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache: Optional[FileCache] = getattr(self, "cache", None)
+            if cache is None:
+                return method(self, *args, **kwargs)
+
+            params = {"args": list(args), "kwargs": kwargs}
+            body = cache.get(endpoint, params)
+            if body is not MISS:
+                return body
+
+            try:
+                body = method(self, *args, **kwargs)
+            except Exception as e:
+                stale = cache.get(endpoint, params, allow_stale=True)
+                if stale is MISS:
+                    raise
+                logger.warning(f"{endpoint} failed ({e}), serving last cached copy")
+                return stale
+
+            body_ttl = ttl(body) if callable(ttl) else ttl
+            if body_ttl is None:
+                stale = cache.get(endpoint, params, allow_stale=True)
+                if stale is not MISS:
+                    logger.warning(f"{endpoint} returned no data, serving last cached copy")
+                    return stale
+                return body
+
+            cache.set(endpoint, params, body, body_ttl)
+            return body
+
+        def invalidate(self, *args, **kwargs) -> None:
+            cache: Optional[FileCache] = getattr(self, "cache", None)
+            if cache is not None:
+                cache.delete(endpoint, {"args": list(args), "kwargs": kwargs})
+
+        def invalidate_all(self) -> None:
+            cache: Optional[FileCache] = getattr(self, "cache", None)
+            if cache is not None:
+                cache.clear(endpoint)
+
+        wrapper.invalidate = invalidate
+        wrapper.invalidate_all = invalidate_all
+        return wrapper
+
+    return decorator
+
+
+def default_cache_dir() -> Path:
+    """
+    Directory for the scanners' response cache
+
+    KALSHI_CACHE_DIR if set, otherwise wellfleet/ under the user cache
+    directory ($XDG_CACHE_HOME or ~/.cache), so the cache doesn't follow
+    whatever directory a script happens to run in.
+    """
+    configured = os.getenv("KALSHI_CACHE_DIR")
+    if configured:
+        return Path(configured).expanduser()
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "wellfleet"
+
+
+def get_ttl(name: str) -> float:
+    """
+    Look up a TTL by name, honoring KALSHI_CACHE_TTL_<NAME> overrides
+
+    Read when each entry is written rather than at import, so values from a
+    .env file loaded after `import scanner` still apply.
+    """
+    value = os.getenv(f"KALSHI_CACHE_TTL_{name}")
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            logger.warning(f"Ignoring invalid KALSHI_CACHE_TTL_{name}={value!r}")
+    return DEFAULT_TTLS[name]
+
+
+def ttl_policy(name: str) -> Callable[[Any], float]:
+    """Build a cached() TTL policy that always uses the named TTL"""
+    return lambda body: get_ttl(name)
+
+
+def nonempty_ttl_policy(name: str) -> Callable[[Any], Optional[float]]:
+    """
+    Build a cached() TTL policy for methods that return an empty body on failure
+
+    Empty results ([], {}, None) are not stored, so a failed fetch never
+    replaces the last good entry, which cached() serves in its place.
+    """
+    return lambda body: get_ttl(name) if body else None
+
+
+def market_ttl(market: Dict) -> float:
+    """TTL for a single market: quote TTL while it can change, metadata TTL once settled"""
+    return get_ttl("METADATA" if market.get("status") in FINAL_MARKET_STATUSES else "QUOTES")
+
+
+def markets_ttl(markets: list) -> float:
+    """TTL for a market list: quote TTL if empty or any market can still change"""
+    if not markets:
+        return get_ttl("QUOTES")
+    return min(market_ttl(market) for market in markets)
@@ -3,6 +3,9 @@ Comprehensive city configuration for climate markets
 Contains coordinates, timezones, and NWS station IDs for major US cities
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 # Comprehensive list of US cities that may have climate markets
 # Format: "City, ST": {"lat": float, "lon": float, "timezone": str, "station_id": str}
 CITY_DATABASE = {
@@ -739,7 +742,33 @@ CITY_ABBREVIATIONS = {
     "SPOKANE": "Spokane, WA",
 }
 
+# Read-only views: the partial-match index and the lru_caches below are derived
+# from these tables and would go stale if they were modified at runtime
+CITY_DATABASE = MappingProxyType(CITY_DATABASE)
+CITY_ABBREVIATIONS = MappingProxyType(CITY_ABBREVIATIONS)
+
+
+def _build_partial_match_index():
+    """
+    Map every lowercase substring of every city name to the first city containing it
+
+    Mirrors the case-insensitive "name contains input" fallback (first match
+    in CITY_DATABASE order wins) as a single dict lookup.
+    """
+    index = {}
+    for full_name in CITY_DATABASE:
+        name_lower = full_name.lower()
+        for start in range(len(name_lower) + 1):
+            for end in range(start, len(name_lower) + 1):
+                index.setdefault(name_lower[start:end], full_name)
+    return index
+
 
+# Built once at import (~6k entries for ~100 cities)
+_PARTIAL_MATCH_INDEX = _build_partial_match_index()
+
+
+@lru_cache(maxsize=512)
 def get_city_config(city_name: str):
     """
     Get configuration for a city by name
@@ -757,14 +786,14 @@ def get_city_config(city_name: str):
             return CITY_DATABASE[full_name]
 
     # Try partial match (case insensitive)
-    city_lower = city_name.lower()
-    for full_name in CITY_DATABASE:
-        if city_lower in full_name.lower():
-            return CITY_DATABASE[full_name]
+    full_name = _PARTIAL_MATCH_INDEX.get(city_name.lower())
+    if full_name:
+        return CITY_DATABASE[full_name]
 
     return None
 
 
+@lru_cache(maxsize=512)
 def normalize_city_name(city_name: str) -> str:
     """
     Normalize a city name to the standard format used in CITY_DATABASE
@@ -780,12 +809,7 @@ def normalize_city_name(city_name: str) -> str:
         return CITY_ABBREVIATIONS[city_upper]
 
     # Try partial match
-    city_lower = city_name.lower()
-    for full_name in CITY_DATABASE:
-        if city_lower in full_name.lower():
-            return full_name
-
-    return None
+    return _PARTIAL_MATCH_INDEX.get(city_name.lower())
 
 
 def get_all_cities():
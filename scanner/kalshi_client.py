@@ -4,28 +4,80 @@ Handles authentication and market data retrieval from Kalshi's REST API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import json as stdlib_json
 import logging
+import random
+import threading
 import time
+import uuid
 import base64
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 
+from .auth import AuthenticationError
+from .cache import FileCache, cached, market_ttl, markets_ttl, ttl_policy
 
-class AuthenticationError(Exception):
-    """Raised when authentication fails"""
-    pass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _parse_json(content: bytes):
+    """Decode a JSON response body, using orjson's C parser when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return stdlib_json.loads(content)
+
+
+# Request signing parameters; immutable, so one instance serves every request
+_SIGNING_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.DIGEST_LENGTH
+)
+_SIGNING_HASH = hashes.SHA256()
+
+
+@lru_cache(maxsize=4)
+def _read_private_key(private_key_path: str):
+    """Load and parse a PEM private key once per path for the life of the process"""
+    with open(private_key_path, 'rb') as f:
+        return serialization.load_pem_private_key(
+            f.read(),
+            password=None
+        )
 
 
 class KalshiClient:
     """Client for interacting with Kalshi's trading API"""
 
+    # Maximum orders per request on the batched create endpoint
+    BATCH_ORDER_LIMIT = 20
+
+    # Retries after the first attempt on rate limits, server errors and dropped
+    # connections. Each attempt is signed afresh, so a retry never carries a stale
+    # KALSHI-ACCESS-TIMESTAMP.
+    MAX_RETRIES = 2
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # Longest wait before a retry, including one asked for by a Retry-After header
+    RETRY_WAIT_MAX = 10
+
+    # GET responses remembered for If-None-Match revalidation (least recently used evicted)
+    ETAG_CACHE_SIZE = 256
+
     def __init__(
         self,
         email: Optional[str] = None,
         password: Optional[str] = None,
         api_key_id: Optional[str] = None,
-        private_key_path: Optional[str] = None
+        private_key_path: Optional[str] = None,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize client and authenticate
@@ -39,22 +91,40 @@ class KalshiClient:
             password: Kalshi account password (for email/password auth)
             api_key_id: API key ID (for API key auth)
             private_key_path: Path to private key file (for API key auth)
+            cache_dir: Directory for cached market data (default None: no caching;
+                       long-running scanners pass cache.default_cache_dir())
         """
         self.base_url = "https://api.elections.kalshi.com/trade-api/v2"
-        self.session = requests.Session()
         self.logger = logging.getLogger(__name__)
 
+        # One pooled session for every call, so connections and TLS sessions are reused
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        self.cache = FileCache(cache_dir) if cache_dir else None
+
         # Authentication state
         self.token = None
         self.member_id = None
         self.api_key_id = api_key_id
         self.private_key = None
 
+        # Cleared the first time the batched order endpoint is refused
+        self._batch_orders_supported = True
+
+        # (endpoint, params) -> (ETag, body) for conditional GETs; shared by worker threads
+        self._etag_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+
         # Determine authentication method
         if api_key_id and private_key_path:
             # API Key authentication
             self.auth_method = "api_key"
             self._load_private_key(private_key_path)
+            # Static auth headers live on the session; requests add only timestamp + signature
+            self.session.headers.update({
+                "Content-Type": "application/json",
+                "KALSHI-ACCESS-KEY": self.api_key_id
+            })
             self.logger.info("Using API key authentication")
         elif email and password:
             # Email/Password authentication
@@ -70,11 +140,7 @@ class KalshiClient:
     def _load_private_key(self, private_key_path: str):
         """Load RSA private key from file"""
         try:
-            with open(private_key_path, 'rb') as f:
-                self.private_key = serialization.load_pem_private_key(
-                    f.read(),
-                    password=None
-                )
+            self.private_key = _read_private_key(private_key_path)
             self.logger.info(f"Loaded private key from {private_key_path}")
         except Exception as e:
             raise AuthenticationError(f"Failed to load private key: {e}")
@@ -103,7 +169,7 @@ class KalshiClient:
               JSON body is NOT included in the signature.
         """
         # Remove query parameters from path before signing (per Kalshi spec)
-        path_without_query = path.split('?')[0]
+        path_without_query = path.split('?', 1)[0]
 
         # Create message: timestamp + method + path (NO JSON body)
         message = f"{timestamp}{method}{path_without_query}"
@@ -111,11 +177,8 @@ class KalshiClient:
         # Sign with RSA-PSS
         signature = self.private_key.sign(
             message.encode('utf-8'),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.DIGEST_LENGTH
-            ),
-            hashes.SHA256()
+            _SIGNING_PADDING,
+            _SIGNING_HASH
         )
 
         # Encode to base64
@@ -136,14 +199,11 @@ class KalshiClient:
 
         try:
             self.logger.info("Authenticating with Kalshi...")
-            response = requests.post(url, json=payload, timeout=30)
+            response = self._send_with_retries("POST", url, lambda: {}, json=payload)
 
+            # A 429 here has already been retried by _send_with_retries
             if response.status_code == 401:
                 raise AuthenticationError("Invalid credentials")
-            elif response.status_code == 429:
-                self.logger.warning("Rate limited on login, retrying...")
-                time.sleep(2)
-                response = requests.post(url, json=payload, timeout=30)
 
             response.raise_for_status()
             data = response.json()
@@ -169,101 +229,136 @@ class KalshiClient:
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
-        json: Optional[Dict] = None,
-        max_retries: int = 3
+        json: Optional[Dict] = None
     ) -> Dict:
         """
-        Make authenticated request with retry logic
+        Make authenticated request
+
+        Rate limits, server errors and dropped connections are retried with
+        backoff (see MAX_RETRIES), re-signing each attempt.
+
+        GET responses that carry an ETag are remembered; repeating the GET sends
+        If-None-Match and a 304 reply is answered from the remembered body.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (without base URL)
             params: Query parameters
             json: JSON payload for POST/PUT requests
-            max_retries: Maximum number of retry attempts
 
         Returns:
             Response JSON data
         """
         url = f"{self.base_url}{endpoint}"
+        method = method.upper()
+
+        # Revalidate a previously seen GET instead of downloading it again
+        etag_key = None
+        cached_entry = None
+        if method == "GET":
+            etag_key = (endpoint, tuple(sorted((params or {}).items())))
+            with self._etag_lock:
+                cached_entry = self._etag_cache.get(etag_key)
+
+        def attempt_headers() -> Dict:
+            """Headers for one attempt; API key requests get a fresh signature each time"""
+            headers = {}
+            if cached_entry:
+                headers["If-None-Match"] = cached_entry[0]
+
+            if self.auth_method == "api_key":
+                # Add API key signature headers
+                timestamp = str(time.time_ns() // 1_000_000)
+
+                # For signature, need to include JSON body if present
+                signature = self._sign_request(
+                    timestamp,
+                    method,
+                    endpoint,
+                    json_body=json
+                )
+
+                # Content-Type and KALSHI-ACCESS-KEY are session defaults (set in __init__)
+                headers["KALSHI-ACCESS-TIMESTAMP"] = timestamp
+                headers["KALSHI-ACCESS-SIGNATURE"] = signature
+            return headers
+
+        # API key requests carry only the signature headers (no Bearer token is
+        # ever set on the session in that mode), so both methods share the pool
+        response = self._send_with_retries(method, url, attempt_headers, params=params, json=json)
+
+        if response.status_code == 304 and cached_entry:
+            with self._etag_lock:
+                if etag_key in self._etag_cache:
+                    self._etag_cache.move_to_end(etag_key)
+            # Parse the stored bytes so callers never share a mutable result
+            return _parse_json(cached_entry[1])
+
+        response.raise_for_status()
+
+        etag = response.headers.get("ETag")
+        if etag_key is not None and etag:
+            self._remember_etag(etag_key, etag, response.content)
+
+        return _parse_json(response.content)
 
-        for attempt in range(max_retries):
+    def _send_with_retries(self, method: str, url: str, make_headers, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying rate limits, server errors and dropped connections
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            make_headers: Called before every attempt to build that attempt's headers
+            **kwargs: Passed through to session.request (params, json)
+
+        Returns:
+            The last response; retry statuses are returned once retries run out
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
             try:
-                # Prepare headers based on auth method
-                headers = {}
-
-                if self.auth_method == "api_key":
-                    # Add API key signature headers
-                    timestamp = str(int(time.time() * 1000))
-
-                    # For signature, need to include JSON body if present
-                    signature = self._sign_request(
-                        timestamp,
-                        method.upper(),
-                        endpoint,
-                        json_body=json
-                    )
-
-                    headers.update({
-                        "Content-Type": "application/json",
-                        "KALSHI-ACCESS-KEY": self.api_key_id,
-                        "KALSHI-ACCESS-TIMESTAMP": timestamp,
-                        "KALSHI-ACCESS-SIGNATURE": signature
-                    })
-
-                # Use requests directly for API key auth to avoid session header conflicts
-                if self.auth_method == "api_key":
-                    response = requests.request(
-                        method=method,
-                        url=url,
-                        params=params,
-                        json=json,
-                        headers=headers,
-                        timeout=30
-                    )
-                else:
-                    # Use session for email/password auth (needs Bearer token)
-                    response = self.session.request(
-                        method=method,
-                        url=url,
-                        params=params,
-                        json=json,
-                        headers=headers,
-                        timeout=30
-                    )
-
-                # Handle rate limiting
-                if response.status_code == 429:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    self.logger.warning(f"Rate limited, waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-
-                # Handle server errors with retry
-                if response.status_code >= 500:
-                    if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt
-                        self.logger.warning(f"Server error {response.status_code}, retrying in {wait_time}s...")
-                        time.sleep(wait_time)
-                        continue
-
-                response.raise_for_status()
-                return response.json()
-
-            except requests.exceptions.Timeout:
-                if attempt < max_retries - 1:
-                    self.logger.warning(f"Request timeout, retrying...")
-                    time.sleep(2)
-                    continue
-                raise
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries - 1:
-                    self.logger.warning(f"Request failed: {e}, retrying...")
-                    time.sleep(2)
-                    continue
-                raise
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=make_headers(),
+                    timeout=30,
+                    **kwargs
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                wait = self._retry_wait(attempt)
+                self.logger.warning(f"Request failed: {e}, retrying in {wait:.1f}s...")
+                time.sleep(wait)
+                continue
+
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                return response
+
+            wait = self._retry_wait(attempt, response.headers.get("Retry-After"))
+            self.logger.warning(f"HTTP {response.status_code} from {url}, retrying in {wait:.1f}s...")
+            time.sleep(wait)
+
+    def _retry_wait(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before retry number attempt + 1, capped at RETRY_WAIT_MAX
 
-        raise Exception(f"Failed after {max_retries} attempts")
+        Honours a numeric Retry-After; otherwise backs off exponentially with
+        random jitter so parallel workers don't retry in lockstep.
+        """
+        try:
+            wait = float(retry_after)
+        except (TypeError, ValueError):
+            wait = 2 ** attempt + random.uniform(0, 1)
+        return min(max(wait, 0.0), self.RETRY_WAIT_MAX)
+
+    def _remember_etag(self, key: tuple, etag: str, content: bytes) -> None:
+        """Store a GET body under its ETag, evicting the least recently used entry"""
+        with self._etag_lock:
+            self._etag_cache[key] = (etag, content)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
 
     def get_events(self, status: str = "open", limit: int = 200) -> List[Dict]:
         """
@@ -290,21 +385,21 @@ class KalshiClient:
 
         return events
 
-    def get_promo_markets(self) -> List[Dict]:
+    def iter_promo_markets(self) -> Iterator[Dict]:
         """
-        Filter events to return only markets with active liquidity pools
+        Yield markets with active liquidity pools one at a time
 
-        Returns:
-            List of market dictionaries with liquidity pool information
-        """
-        events = self.get_events(status="open")
-        promo_markets = []
+        Markets are formatted as they are reached in the events response, so
+        callers that stop early or filter inline never build the full list.
 
-        for event in events:
+        Yields:
+            Market dictionaries with liquidity pool information
+        """
+        for event in self.get_events(status="open"):
             for market in event.get("markets", []):
                 # Check if market has an active liquidity pool
                 if market.get("liquidity_pool"):
-                    promo_markets.append({
+                    yield {
                         "ticker": market["ticker"],
                         "title": market["title"],
                         "event_ticker": event["event_ticker"],
@@ -318,7 +413,17 @@ class KalshiClient:
                         "liquidity_pool": market["liquidity_pool"],
                         "category": event.get("category"),
                         "status": market.get("status"),
-                    })
+                    }
+
+    @cached(ttl=ttl_policy("QUOTES"))
+    def get_promo_markets(self) -> List[Dict]:
+        """
+        Filter events to return only markets with active liquidity pools
+
+        Returns:
+            List of market dictionaries with liquidity pool information
+        """
+        promo_markets = list(self.iter_promo_markets())
 
         self.logger.info(f"Found {len(promo_markets)} markets with liquidity pools")
         return promo_markets
@@ -338,6 +443,37 @@ class KalshiClient:
 
         return data.get("orderbook", {})
 
+    def get_orderbooks(self, tickers: List[str], max_workers: int = 16) -> Dict[str, Dict]:
+        """
+        Fetch orderbooks for several markets concurrently
+
+        There is no batched orderbook endpoint, so requests are issued on a
+        bounded thread pool over the shared session and their round-trips overlap.
+
+        Args:
+            tickers: Market ticker symbols
+            max_workers: Maximum requests in flight at once
+
+        Returns:
+            Dict mapping ticker to orderbook; tickers whose request failed are
+            logged and omitted
+        """
+        if not tickers:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as executor:
+            futures = {ticker: executor.submit(self.get_orderbook, ticker) for ticker in tickers}
+
+        orderbooks = {}
+        for ticker, future in futures.items():
+            try:
+                orderbooks[ticker] = future.result()
+            except Exception as e:
+                self.logger.warning(f"Failed to fetch orderbook for {ticker}: {e}")
+
+        return orderbooks
+
+    @cached(ttl=market_ttl)
     def get_market(self, ticker: str) -> Dict:
         """
         Fetch detailed information for a specific market
@@ -353,6 +489,24 @@ class KalshiClient:
 
         return data.get("market", {})
 
+    def invalidate_market(self, ticker: str) -> None:
+        """
+        Drop cached quotes for a market so the next lookup refetches them
+
+        Besides the market's own get_market entry this clears the market lists
+        (series, batch and promo lookups), which may also hold its pre-trade
+        quotes. They are keyed by series or ticker set rather than by market, so
+        they are dropped wholesale.
+
+        Args:
+            ticker: Market ticker symbol
+        """
+        KalshiClient.get_market.invalidate(self, ticker)
+        KalshiClient.get_markets_for_series.invalidate_all(self)
+        KalshiClient.get_markets_batch.invalidate_all(self)
+        KalshiClient.get_promo_markets.invalidate_all(self)
+
+    @cached(ttl=ttl_policy("METADATA"))
     def get_series(self, series_ticker: str) -> Dict:
         """
         Fetch information about a series
@@ -368,6 +522,7 @@ class KalshiClient:
 
         return data.get("series", {})
 
+    @cached(ttl=markets_ttl)
     def get_markets_for_series(self, series_ticker: str, status: str = "open") -> List[Dict]:
         """
         Fetch all markets for a specific series
@@ -393,6 +548,46 @@ class KalshiClient:
 
         return markets
 
+    @cached(ttl=lambda markets: markets_ttl(list(markets.values())))
+    def get_markets_batch(self, tickers: List[str], chunk_size: int = 100) -> Dict[str, Dict]:
+        """
+        Fetch several markets by ticker, one request per chunk_size tickers
+
+        Args:
+            tickers: Market tickers to fetch
+            chunk_size: Tickers per request (keeps the query string bounded)
+
+        Returns:
+            Dictionary of ticker -> market dictionary; tickers Kalshi doesn't
+            know are absent
+        """
+        # Preserve order while dropping duplicates so each ticker is requested once
+        unique_tickers = list(dict.fromkeys(tickers))
+        if not unique_tickers:
+            return {}
+
+        endpoint = "/markets"
+        wanted = set(unique_tickers)
+        markets = {}
+
+        self.logger.info(
+            f"Fetching {len(unique_tickers)} markets in "
+            f"{-(-len(unique_tickers) // chunk_size)} request(s)"
+        )
+        for start in range(0, len(unique_tickers), chunk_size):
+            chunk = unique_tickers[start:start + chunk_size]
+            params = {
+                "tickers": ",".join(chunk),
+                "limit": 1000
+            }
+            data = self._make_request("GET", endpoint, params=params)
+
+            for market in data.get("markets", []):
+                if market.get("ticker") in wanted:
+                    markets[market["ticker"]] = market
+
+        return markets
+
     def get_balance(self) -> Dict:
         """
         Get account balance
@@ -436,12 +631,45 @@ class KalshiClient:
         """
         endpoint = "/portfolio/orders"
 
+        payload = self._build_order_payload(
+            ticker, side, action, count, order_type, yes_price, no_price
+        )
+
+        self.logger.info(
+            f"Placing {action} order: {count}x {ticker} {side.upper()} "
+            f"@ {order_type}"
+        )
+
+        data = self._make_request("POST", endpoint, json=payload)
+
+        order = data.get("order", {})
+        self.logger.info(f"Order placed: {order.get('order_id', 'unknown')}")
+
+        # Our own fill moves the quotes; don't serve the pre-trade copy
+        self.invalidate_market(ticker)
+
+        return order
+
+    def _build_order_payload(
+        self,
+        ticker: str,
+        side: str,
+        action: str = "buy",
+        count: int = 1,
+        order_type: str = "market",
+        yes_price: Optional[int] = None,
+        no_price: Optional[int] = None
+    ) -> Dict:
+        """Build the JSON body for a create-order request (see place_order for args)"""
         payload = {
             "ticker": ticker,
             "action": action,
             "side": side.lower(),
             "count": count,
-            "type": order_type
+            "type": order_type,
+            # Kalshi rejects a repeated client_order_id, so a retried POST whose
+            # first attempt was accepted (e.g. a 502 after the fact) can't fill twice
+            "client_order_id": str(uuid.uuid4())
         }
 
         # Add limit prices if specified
@@ -453,17 +681,92 @@ class KalshiClient:
             else:
                 raise ValueError(f"Limit order requires price: yes_price for YES, no_price for NO")
 
-        self.logger.info(
-            f"Placing {action} order: {count}x {ticker} {side.upper()} "
-            f"@ {order_type}"
-        )
+        return payload
 
-        data = self._make_request("POST", endpoint, json=payload)
+    def place_orders_batch(self, orders: List[Dict], max_workers: int = 5) -> List[Dict]:
+        """
+        Place several orders with as few round-trips as possible
 
-        order = data.get("order", {})
-        self.logger.info(f"Order placed: {order.get('order_id', 'unknown')}")
+        Uses Kalshi's batched create endpoint (up to 20 orders per request). Accounts
+        without access to it fall back to individual place_order calls issued
+        concurrently.
 
-        return order
+        Args:
+            orders: List of place_order keyword dicts (ticker, side, action, count, ...)
+            max_workers: Concurrent requests for the per-order fallback
+
+        Returns:
+            One dict per input order, in order: {"order": {...}} on success or
+            {"error": "..."} on failure
+        """
+        if not orders:
+            return []
+
+        if self._batch_orders_supported:
+            try:
+                return self._place_orders_batched(orders)
+            except requests.exceptions.HTTPError as e:
+                if e.response is None or e.response.status_code not in (403, 404, 405):
+                    raise
+                self.logger.info("Batched order endpoint unavailable, placing orders individually")
+                self._batch_orders_supported = False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.place_order, **order) for order in orders]
+
+        results = []
+        for future in futures:
+            try:
+                results.append({"order": future.result()})
+            except Exception as e:
+                results.append({"error": str(e)})
+
+        return results
+
+    def _place_orders_batched(self, orders: List[Dict]) -> List[Dict]:
+        """
+        POST orders to the batched create endpoint in chunks of BATCH_ORDER_LIMIT
+
+        A failure on the first chunk is raised, since nothing has been placed yet
+        and the caller may fall back to individual orders. A failure on a later
+        chunk only marks that chunk's orders as errors, so orders already placed
+        by earlier chunks are still reported as placed.
+        """
+        endpoint = "/portfolio/orders/batched"
+        results = []
+
+        for start in range(0, len(orders), self.BATCH_ORDER_LIMIT):
+            chunk = orders[start:start + self.BATCH_ORDER_LIMIT]
+            payload = {"orders": [self._build_order_payload(**order) for order in chunk]}
+
+            self.logger.info(f"Placing batch of {len(chunk)} orders")
+            try:
+                data = self._make_request("POST", endpoint, json=payload)
+            except requests.exceptions.RequestException as e:
+                if start == 0:
+                    raise
+                self.logger.error(f"Batch of {len(chunk)} orders failed: {e}")
+                results.extend({"error": str(e)} for _ in chunk)
+                continue
+
+            for ticker in {order["ticker"] for order in chunk}:
+                self.invalidate_market(ticker)
+
+            entries = data.get("orders", [])
+            if len(entries) != len(chunk):
+                # Can't tell which response belongs to which order, so don't guess
+                error = f"Batch response had {len(entries)} entries for {len(chunk)} orders"
+                self.logger.error(error)
+                results.extend({"error": error} for _ in chunk)
+                continue
+
+            for entry in entries:
+                if entry.get("error"):
+                    results.append({"error": str(entry["error"])})
+                else:
+                    results.append({"order": entry.get("order", {})})
+
+        return results
 
     def get_orders(self, ticker: Optional[str] = None, status: str = "resting") -> List[Dict]:
         """
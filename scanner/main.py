@@ -5,20 +5,38 @@ Coordinates all components to scan for weather arbitrage opportunities
 
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from .kalshi_client import KalshiClient
-from .nws_adapter import NWSAdapter
+import pytz
+
+from .cache import default_cache_dir
 from .market_parser import MarketParser
 from .mispricing_detector import MispricingDetector, Opportunity
-from .report_generator import ReportGenerator
+from .report_generator import ReportGenerator, write_atomic
+
+
+# Title keywords (lowercase) that mark a temperature/weather market
+WEATHER_KEYWORDS = ("temperature", "weather", "lowest", "highest", "warmest", "coldest")
+
+
+def _is_weather_title(title: str) -> bool:
+    """True if a market title mentions any of WEATHER_KEYWORDS (case-insensitive)"""
+    title = title.lower()
+    for keyword in WEATHER_KEYWORDS:
+        if keyword in title:
+            return True
+    return False
 
 
 class KalshiWeatherScanner:
     """Main orchestrator for the Kalshi weather arbitrage scanner"""
 
+    # Concurrent HTTP requests when prefetching series and per-location NWS data
+    MAX_FETCH_WORKERS = 8
+
     def __init__(
         self,
         email: Optional[str] = None,
@@ -41,14 +59,21 @@ class KalshiWeatherScanner:
             kelly_fraction: Fraction of Kelly criterion to use
             min_edge_threshold: Minimum edge required to flag opportunities
         """
-        # Initialize components
+        # The HTTP clients pull in requests and cryptography; import them here so
+        # code that only needs the module's helpers (e.g. the title filter) stays light
+        from .kalshi_client import KalshiClient
+        from .nws_adapter import NWSAdapter
+
+        # Initialize components, sharing the user-level response cache
+        cache_dir = str(default_cache_dir())
         self.kalshi = KalshiClient(
             email=email,
             password=password,
             api_key_id=api_key_id,
-            private_key_path=private_key_path
+            private_key_path=private_key_path,
+            cache_dir=cache_dir
         )
-        self.nws = NWSAdapter()
+        self.nws = NWSAdapter(cache_dir=cache_dir)
         self.parser = MarketParser()
         self.detector = MispricingDetector(
             bankroll=bankroll,
@@ -103,151 +128,237 @@ class KalshiWeatherScanner:
         # Step 3: Analyze each market
         opportunities = []
 
-        for market in weather_markets:
-            self.logger.info("\n")
-            self.logger.info("-"*100)
-            self.logger.info(f"Analyzing: {market['title'][:80]}...")
+        with ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS) as executor:
+            nws_data = self._prefetch_nws_data(weather_markets, executor)
+            for market in weather_markets:
+                opp = self._analyze_market(market, nws_data)
+                if opp:
+                    opportunities.append(opp)
 
-            try:
-                # Parse market
-                parsed = self.parser.parse(market["title"], market["ticker"])
+        self.logger.info("=" * 60)
+        self.logger.info(f"Scan complete. Found {len(opportunities)} opportunities.")
+        self.logger.info("=" * 60)
 
-                if not parsed.is_parseable:
-                    self.logger.warning(f"  ⚠ Could not parse market: {market['ticker']}")
-                    continue
+        return opportunities
 
-                self.logger.info(
-                    f"  ✓ Parsed: {parsed.location}, {parsed.metric} "
-                    f"{parsed.comparison} {parsed.threshold}°F on {parsed.date}"
-                )
+    def _prefetch_nws_data(
+        self,
+        markets: List[dict],
+        executor: ThreadPoolExecutor
+    ) -> Dict[str, Dict[str, Future]]:
+        """
+        Start the NWS requests for every location in the scan at once
+
+        Many markets share a location (one per strike and date), so each
+        location's forecast, conditions, observations and leading indicators
+        are requested once and concurrently instead of once per market. The
+        preliminary CLI report is requested once per location when any of its
+        markets settles today (local time).
+
+        Args:
+            markets: Markets about to be analyzed
+            executor: Executor to run the requests on
+
+        Returns:
+            Dict mapping location to futures keyed "forecast", "current_conditions",
+            "observations", "leading_indicators" and "preliminary_reports" (station
+            data only when the location has a station; "preliminary_reports" maps
+            today's date string to its future)
+        """
+        nws_data = {}
+        local_today = {}  # location -> today's date string in the station's timezone
+
+        for market in markets:
+            parsed = self.parser.parse(market["title"], market["ticker"])
+            if not parsed.is_parseable:
+                continue
+
+            location_info = self.nws.LOCATIONS.get(parsed.location)
+            has_station = bool(location_info and "station_id" in location_info)
 
-                # Get NWS forecast
+            if parsed.location not in nws_data:
                 city, state = self._parse_location(parsed.location)
                 if not city or not state:
-                    self.logger.warning(f"  ⚠ Could not parse location: {parsed.location}")
                     continue
 
-                forecast_periods = self.nws.get_forecast_for_city(city, state)
-
-                # Get current conditions and observations FIRST (needed for today's actual temps)
-                current_conditions = None
-                observations = None
-                preliminary_report = None
+                futures = {"forecast": executor.submit(self.nws.get_forecast_for_city, city, state)}
 
-                location_info = self.nws.LOCATIONS.get(parsed.location)
-                if location_info and "station_id" in location_info:
+                if has_station:
                     station_id = location_info["station_id"]
-                    timezone = location_info["timezone"]
+                    futures["current_conditions"] = executor.submit(self.nws.get_current_conditions, station_id)
+                    futures["observations"] = executor.submit(self.nws.get_observations, station_id)
+                    futures["leading_indicators"] = executor.submit(
+                        self.nws.get_leading_indicator_insights,
+                        target_station_id=station_id,
+                        target_city_state=parsed.location
+                    )
+                    futures["preliminary_reports"] = {}
+                    local_today[parsed.location] = datetime.now(
+                        pytz.timezone(location_info["timezone"])
+                    ).date().isoformat()
+
+                nws_data[parsed.location] = futures
+
+            # Today's markets also use the preliminary CLI report (one request per location)
+            if has_station:
+                date_str = parsed.date.isoformat()
+                reports = nws_data[parsed.location]["preliminary_reports"]
+                if date_str == local_today[parsed.location] and date_str not in reports:
+                    reports[date_str] = executor.submit(
+                        self.nws.get_preliminary_climate_report,
+                        station_id=location_info["station_id"],
+                        date_str=date_str
+                    )
 
-                    try:
-                        # Fetch current conditions
-                        current_conditions = self.nws.get_current_conditions(station_id)
+        return nws_data
 
-                        # Fetch recent observations (last 200 = ~24-48 hours of hourly data)
-                        # Critical for today's markets - gives us actual temps from earlier today
-                        # Need enough observations to capture overnight lows/highs
-                        observations = self.nws.get_observations(station_id)
+    def _analyze_market(
+        self,
+        market: dict,
+        nws_data: Dict[str, Dict[str, Future]]
+    ) -> Optional[Opportunity]:
+        """
+        Parse one market, combine it with its location's NWS data, and detect mispricing
 
-                        if current_conditions:
+        Args:
+            market: Market dictionary
+            nws_data: Prefetched NWS futures from _prefetch_nws_data
+
+        Returns:
+            Opportunity if the market is mispriced, None otherwise
+        """
+        self.logger.info("\n")
+        self.logger.info("-"*100)
+        self.logger.info(f"Analyzing: {market['title'][:80]}...")
+
+        try:
+            # Parse market
+            parsed = self.parser.parse(market["title"], market["ticker"])
+
+            if not parsed.is_parseable:
+                self.logger.warning(f"  ⚠ Could not parse market: {market['ticker']}")
+                return None
+
+            self.logger.info(
+                f"  ✓ Parsed: {parsed.location}, {parsed.metric} "
+                f"{parsed.comparison} {parsed.threshold}°F on {parsed.date}"
+            )
+
+            # Get NWS forecast (prefetched per location)
+            city, state = self._parse_location(parsed.location)
+            if not city or not state:
+                self.logger.warning(f"  ⚠ Could not parse location: {parsed.location}")
+                return None
+
+            location_data = nws_data[parsed.location]
+            forecast_periods = location_data["forecast"].result()
+
+            # Get current conditions and observations FIRST (needed for today's actual temps)
+            current_conditions = None
+            observations = None
+            preliminary_report = None
+
+            location_info = self.nws.LOCATIONS.get(parsed.location)
+            if location_info and "station_id" in location_info:
+                try:
+                    # Current conditions (prefetched per location)
+                    current_conditions = location_data["current_conditions"].result()
+
+                    # Fetch recent observations (last 200 = ~24-48 hours of hourly data)
+                    # Critical for today's markets - gives us actual temps from earlier today
+                    # Need enough observations to capture overnight lows/highs
+                    observations = location_data["observations"].result()
+
+                    if current_conditions:
+                        self.logger.info(
+                            f"  ✓ Current: {current_conditions['temperature']:.1f}°F, "
+                            f"wind={current_conditions['wind_speed']:.1f}mph, "
+                            f"sky={current_conditions['sky_cover']}%"
+                        )
+                except Exception as e:
+                    self.logger.warning(f"  ⚠ Could not fetch current conditions: {e}")
+
+                # Preliminary CLI report for today's markets (prefetched per location)
+                # This is more reliable than individual observations due to quality control
+                preliminary_future = location_data["preliminary_reports"].get(parsed.date.isoformat())
+                if preliminary_future:
+                    try:
+                        preliminary_report = preliminary_future.result()
+                        if preliminary_report:
                             self.logger.info(
-                                f"  ✓ Current: {current_conditions['temperature']:.1f}°F, "
-                                f"wind={current_conditions['wind_speed']:.1f}mph, "
-                                f"sky={current_conditions['sky_cover']}%"
+                                f"  ✓ Preliminary CLI: "
+                                f"MIN={preliminary_report.get('preliminary_min', 'N/A')}°F, "
+                                f"MAX={preliminary_report.get('preliminary_max', 'N/A')}°F"
                             )
                     except Exception as e:
-                        self.logger.warning(f"  ⚠ Could not fetch current conditions: {e}")
-
-                    # Fetch preliminary CLI report for today's markets
-                    # This is more reliable than individual observations due to quality control
-                    if parsed.date.isoformat() == datetime.now(pytz.timezone(timezone)).date().isoformat():
-                        try:
-                            preliminary_report = self.nws.get_preliminary_climate_report(
-                                station_id=station_id,
-                                date_str=parsed.date.isoformat()
-                            )
-                            if preliminary_report:
+                        self.logger.warning(f"  ⚠ Could not fetch preliminary CLI: {e}")
+
+            # Extract stats for target date with meteorological data
+            # Pass observations so we include actual temps from earlier today (if target_date is today)
+            # Also pass preliminary CLI report if available (more reliable than observations)
+            timezone = self.nws.LOCATIONS[parsed.location]["timezone"]
+            forecast = self.nws.extract_temperature_stats_for_date(
+                forecast_periods,
+                parsed.date.isoformat(),
+                timezone,
+                include_meteorology=True,  # Include sky cover, wind, dewpoint
+                observations=observations,  # Include actual observations for today
+                preliminary_report=preliminary_report  # Include preliminary CLI report
+            )
+
+            if not forecast:
+                self.logger.warning(f"  ⚠ No forecast data available for {parsed.date}")
+                return None
+
+            self.logger.info(
+                f"  ✓ Forecast: min={forecast['min']:.1f}°F, "
+                f"max={forecast['max']:.1f}°F, avg={forecast['avg']:.1f}°F"
+            )
+
+            # Check for leading indicator insights (e.g., Cheyenne → Denver)
+            leading_indicator_insights = None
+            if location_info and "station_id" in location_info:
+                try:
+                    leading_indicator_insights = location_data["leading_indicators"].result()
+
+                    if leading_indicator_insights and leading_indicator_insights.get("has_leading_indicators"):
+                        recommendation = leading_indicator_insights.get("recommendation")
+                        if recommendation != "no_change":
+                            insights = leading_indicator_insights.get("insights", [])
+                            if insights:
+                                primary = insights[0]
                                 self.logger.info(
-                                    f"  ✓ Preliminary CLI: "
-                                    f"MIN={preliminary_report.get('preliminary_min', 'N/A')}°F, "
-                                    f"MAX={preliminary_report.get('preliminary_max', 'N/A')}°F"
+                                    f"  🌡️ Leading indicator {primary['station_id']}: "
+                                    f"{primary['trend']} at {primary['rate_per_hour']:+.1f}°F/hr "
+                                    f"→ {recommendation.replace('_', ' ')}"
                                 )
-                        except Exception as e:
-                            self.logger.warning(f"  ⚠ Could not fetch preliminary CLI: {e}")
-
-                # Extract stats for target date with meteorological data
-                # Pass observations so we include actual temps from earlier today (if target_date is today)
-                # Also pass preliminary CLI report if available (more reliable than observations)
-                timezone = self.nws.LOCATIONS[parsed.location]["timezone"]
-                forecast = self.nws.extract_temperature_stats_for_date(
-                    forecast_periods,
-                    parsed.date.isoformat(),
-                    timezone,
-                    include_meteorology=True,  # Include sky cover, wind, dewpoint
-                    observations=observations,  # Include actual observations for today
-                    preliminary_report=preliminary_report  # Include preliminary CLI report
-                )
-
-                if not forecast:
-                    self.logger.warning(f"  ⚠ No forecast data available for {parsed.date}")
-                    continue
-
+                except Exception as e:
+                    self.logger.warning(f"  ⚠ Could not fetch leading indicators: {e}")
+
+            # Detect mispricing
+            opp = self.detector.analyze_temperature_market(
+                market,
+                parsed,
+                forecast,
+                current_conditions=current_conditions,
+                observations=observations,
+                leading_indicator_insights=leading_indicator_insights
+            )
+
+            if opp:
                 self.logger.info(
-                    f"  ✓ Forecast: min={forecast['min']:.1f}°F, "
-                    f"max={forecast['max']:.1f}°F, avg={forecast['avg']:.1f}°F"
+                    f"  🎯 OPPORTUNITY: {opp.edge:+.1%} edge, "
+                    f"bet {opp.recommended_side} for ${opp.recommended_bet_size:.2f}"
                 )
+            else:
+                self.logger.info("  ✓ Market efficiently priced")
+                self.logger.info("_"*100)
 
-                # Check for leading indicator insights (e.g., Cheyenne → Denver)
-                leading_indicator_insights = None
-                if location_info and "station_id" in location_info:
-                    try:
-                        leading_indicator_insights = self.nws.get_leading_indicator_insights(
-                            target_station_id=station_id,
-                            target_city_state=parsed.location
-                        )
+            return opp
 
-                        if leading_indicator_insights and leading_indicator_insights.get("has_leading_indicators"):
-                            recommendation = leading_indicator_insights.get("recommendation")
-                            if recommendation != "no_change":
-                                insights = leading_indicator_insights.get("insights", [])
-                                if insights:
-                                    primary = insights[0]
-                                    self.logger.info(
-                                        f"  🌡️ Leading indicator {primary['station_id']}: "
-                                        f"{primary['trend']} at {primary['rate_per_hour']:+.1f}°F/hr "
-                                        f"→ {recommendation.replace('_', ' ')}"
-                                    )
-                    except Exception as e:
-                        self.logger.warning(f"  ⚠ Could not fetch leading indicators: {e}")
-
-                # Detect mispricing
-                opp = self.detector.analyze_temperature_market(
-                    market,
-                    parsed,
-                    forecast,
-                    current_conditions=current_conditions,
-                    observations=observations,
-                    leading_indicator_insights=leading_indicator_insights
-                )
-
-                if opp:
-                    opportunities.append(opp)
-                    self.logger.info(
-                        f"  🎯 OPPORTUNITY: {opp.edge:+.1%} edge, "
-                        f"bet {opp.recommended_side} for ${opp.recommended_bet_size:.2f}"
-                    )
-                else:
-                    self.logger.info("  ✓ Market efficiently priced")
-                    self.logger.info("_"*100)
-
-            except Exception as e:
-                self.logger.error(f"  ✗ Error analyzing market: {e}", exc_info=True)
-                continue
-
-        self.logger.info("=" * 60)
-        self.logger.info(f"Scan complete. Found {len(opportunities)} opportunities.")
-        self.logger.info("=" * 60)
-
-        return opportunities
+        except Exception as e:
+            self.logger.error(f"  ✗ Error analyzing market: {e}", exc_info=True)
+            return None
 
     def _fetch_markets_from_series(self, series_tickers: List[str]) -> List[dict]:
         """
@@ -260,12 +371,20 @@ class KalshiWeatherScanner:
             List of market dictionaries
         """
         all_markets = []
+
+        # Request every series at once; results are still processed in input order
+        with ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS) as executor:
+            futures = {
+                series_ticker: executor.submit(self.kalshi.get_markets_for_series, series_ticker, status="open")
+                for series_ticker in series_tickers
+            }
+
         for series_ticker in series_tickers:
             try:
                 self.logger.info(f"Fetching series: {series_ticker}")
 
                 # Get all open markets for this series
-                markets = self.kalshi.get_markets_for_series(series_ticker, status="open")
+                markets = futures[series_ticker].result()
 
                 # Format each market
                 for market in markets:
@@ -305,11 +424,19 @@ class KalshiWeatherScanner:
         Returns:
             List of market dictionaries
         """
+        # Fetch all tickers in one request; results are consumed in the original order
+        try:
+            markets_by_ticker = self.kalshi.get_markets_batch(tickers)
+        except Exception as e:
+            self.logger.error(f"  ✗ Failed to fetch markets: {e}")
+            return []
+
         markets = []
         for ticker in tickers:
             try:
-                self.logger.info(f"Fetching market: {ticker}")
-                market = self.kalshi.get_market(ticker)
+                market = markets_by_ticker.get(ticker)
+                if market is None:
+                    raise ValueError("market not found")
 
                 # Format market data to match promo_markets structure
                 formatted_market = {
@@ -346,17 +473,7 @@ class KalshiWeatherScanner:
         Returns:
             List of weather/temperature markets (all locations)
         """
-        weather_markets = []
-        for market in markets:
-            title = market["title"].lower()
-
-            # Check if it's a temperature/weather market
-            is_weather = any(keyword in title for keyword in [
-                "temperature", "weather", "lowest", "highest", "warmest", "coldest"
-            ])
-
-            if is_weather:
-                weather_markets.append(market)
+        weather_markets = [market for market in markets if _is_weather_title(market["title"])]
 
         self.logger.info(f"Found {len(weather_markets)} weather/temperature markets")
         return weather_markets
@@ -404,19 +521,16 @@ class KalshiWeatherScanner:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         md_path = f"{output_dir}/kalshi_report_{timestamp}.md"
-        with open(md_path, "w") as f:
-            f.write(report_md)
+        write_atomic(md_path, report_md)
         self.logger.info(f"Saved Markdown report: {md_path}")
 
         csv_path = f"{output_dir}/kalshi_opportunities_{timestamp}.csv"
-        with open(csv_path, "w") as f:
-            f.write(report_csv)
+        write_atomic(csv_path, report_csv)
         self.logger.info(f"Saved CSV export: {csv_path}")
 
         # Also save latest as current.md
         current_path = f"{output_dir}/current.md"
-        with open(current_path, "w") as f:
-            f.write(report_md)
+        write_atomic(current_path, report_md)
         self.logger.info(f"Saved current report: {current_path}")
 
         # Print summary
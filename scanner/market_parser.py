@@ -6,14 +6,26 @@ Extracts structured data from Kalshi market titles
 import re
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, date
 from .city_config import normalize_city_name, CITY_ABBREVIATIONS
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _parse_date(date_str: str, fmt: str) -> date:
+    """
+    strptime a title date, memoized since every strike in a series shares its date
+
+    Raises:
+        ValueError: If date_str doesn't match fmt (failures are not cached)
+    """
+    return datetime.strptime(date_str, fmt).date()
+
+
+@dataclass(frozen=True, slots=True)
 class ParsedMarket:
-    """Structured representation of a parsed market"""
+    """Structured representation of a parsed market (immutable, since parse results are shared)"""
     ticker: str
     location: Optional[str] = None
     metric: Optional[str] = None  # "minimum", "maximum", "average"
@@ -88,6 +100,11 @@ class MarketParser:
         """Initialize the market parser"""
         self.logger = logging.getLogger(__name__)
 
+        # Per-instance parse cache, keyed by (title, ticker, year): titles without a
+        # year ("on January 16") are completed with the current one, so entries
+        # must not outlive New Year in long-running processes
+        self._parse_cached = lru_cache(maxsize=4096)(self._parse_uncached)
+
     def parse(self, title: str, ticker: str) -> ParsedMarket:
         """
         Parse a market title to extract structured information
@@ -98,7 +115,19 @@ class MarketParser:
 
         Returns:
             ParsedMarket object with extracted information
+
+        Results are cached per (title, ticker) for the current year, so
+        re-parsing the same markets on every poll is a dict lookup. The returned
+        object is shared between callers, which is why ParsedMarket is frozen.
         """
+        return self._parse_cached(title, ticker, datetime.now().year)
+
+    def _parse_uncached(self, title: str, ticker: str, year: Optional[int] = None) -> ParsedMarket:
+        """Parse a market title without consulting the cache (year completes year-less dates)"""
+        # Every pattern below contains "temperature"; reject other titles without running them
+        if "temperature" not in title.lower():
+            return self._unparseable(title, ticker)
+
         # Try Pattern 1: Simple threshold (above/below)
         match = self.PATTERN_SIMPLE.search(title)
         if match:
@@ -117,14 +146,17 @@ class MarketParser:
         # Try Pattern 4: Lowest/Highest (without year)
         match = self.PATTERN_LOWEST_HIGHEST.search(title)
         if match:
-            return self._parse_lowest_highest(match, ticker)
+            return self._parse_lowest_highest(match, ticker, year)
 
         # Try Pattern 5: Compact format (>X°, <X°, X-Y°)
         match = self.PATTERN_COMPACT.search(title)
         if match:
             return self._parse_compact(match, ticker)
 
-        # Unable to parse
+        return self._unparseable(title, ticker)
+
+    def _unparseable(self, title: str, ticker: str) -> ParsedMarket:
+        """Log and return the result for a title no pattern matches"""
         self.logger.warning(f"Unable to parse market title: {title}")
         return ParsedMarket(ticker=ticker, is_parseable=False)
 
@@ -138,7 +170,7 @@ class MarketParser:
             date_str = match.group(5)
 
             # Parse date
-            parsed_date = datetime.strptime(date_str, "%B %d, %Y").date()
+            parsed_date = _parse_date(date_str, "%B %d, %Y")
 
             return ParsedMarket(
                 ticker=ticker,
@@ -163,7 +195,7 @@ class MarketParser:
             date_str = match.group(5)
 
             # Parse date
-            parsed_date = datetime.strptime(date_str, "%B %d, %Y").date()
+            parsed_date = _parse_date(date_str, "%B %d, %Y")
 
             return ParsedMarket(
                 ticker=ticker,
@@ -189,7 +221,7 @@ class MarketParser:
             date_str = match.group(5)
 
             # Parse date
-            parsed_date = datetime.strptime(date_str, "%B %d, %Y").date()
+            parsed_date = _parse_date(date_str, "%B %d, %Y")
 
             # Convert "at least" to "above" and "at most" to "below"
             comparison = "above" if modifier == "least" else "below"
@@ -207,7 +239,7 @@ class MarketParser:
             self.logger.error(f"Error parsing at least/most: {e}")
             return ParsedMarket(ticker=ticker, is_parseable=False)
 
-    def _parse_lowest_highest(self, match: re.Match, ticker: str) -> ParsedMarket:
+    def _parse_lowest_highest(self, match: re.Match, ticker: str, year: Optional[int] = None) -> ParsedMarket:
         """Parse 'lowest/highest temperature' pattern (without year in date)"""
         try:
             metric_word = match.group(1).lower()  # "lowest", "highest", or "average"
@@ -226,12 +258,12 @@ class MarketParser:
 
             # Parse date - add current year since it's not specified
             # Format is "January 16" without year
-            current_year = datetime.now().year
+            current_year = year or datetime.now().year
             try:
-                parsed_date = datetime.strptime(f"{date_str}, {current_year}", "%B %d, %Y").date()
+                parsed_date = _parse_date(f"{date_str}, {current_year}", "%B %d, %Y")
             except ValueError:
                 # If that fails, try next year (for dates that might have rolled over)
-                parsed_date = datetime.strptime(f"{date_str}, {current_year + 1}", "%B %d, %Y").date()
+                parsed_date = _parse_date(f"{date_str}, {current_year + 1}", "%B %d, %Y")
 
             # Try to normalize city name if it's just a city without state
             if "," not in location:
@@ -264,7 +296,7 @@ class MarketParser:
             date_str = match.group(5)  # e.g., "Jan 17, 2026"
 
             # Parse date
-            parsed_date = datetime.strptime(date_str, "%b %d, %Y").date()
+            parsed_date = _parse_date(date_str, "%b %d, %Y")
 
             # Infer location from ticker using abbreviation mapping
             # KXLOWTDEN → Denver, CO
@@ -320,3 +352,4 @@ class MarketParser:
         except (ValueError, IndexError) as e:
             self.logger.error(f"Error parsing compact format: {e}")
             return ParsedMarket(ticker=ticker, is_parseable=False)
+
@@ -6,16 +6,108 @@ Compares market prices against NWS forecast data to identify arbitrage opportuni
 import logging
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, date
 from typing import Dict, Optional, List
 
 from .market_parser import ParsedMarket
 
-try:
-    from scipy.stats import norm
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
+logger = logging.getLogger(__name__)
+
+
+def _normal_cdf(x: float, mean: float, std: float) -> float:
+    """
+    Normal CDF P(X <= x) for X ~ N(mean, std²)
+
+    Uses math.erfc directly; scipy.stats.norm.cdf costs ~300x more per scalar call.
+    """
+    return 0.5 * math.erfc((mean - x) / (std * math.sqrt(2)))
+
+
+@lru_cache(maxsize=4096)
+def step_probability(
+    forecast_value: float,
+    threshold: float,
+    threshold_high: Optional[float],
+    comparison: str
+) -> float:
+    """
+    Heuristic probability that a market resolves YES given a point forecast
+
+    Pure function of its arguments, memoized for the detector's simple model.
+    Call step_probability.cache_info() for hit/miss counts.
+    """
+    if comparison in ["above", "at least"]:
+        # Question: Will temp be >= threshold?
+        distance = forecast_value - threshold
+
+        if distance > 5:
+            return 0.95  # Very confident YES
+        elif distance > 2:
+            return 0.85  # Confident YES
+        elif distance > 0:
+            return 0.70  # Likely YES, but within error margin
+        elif distance > -2:
+            return 0.50  # Uncertain (within forecast error)
+        elif distance > -5:
+            return 0.15  # Unlikely
+        else:
+            return 0.05  # Very unlikely
+
+    elif comparison in ["below", "at most"]:
+        # Question: Will temp be <= threshold? (inclusive)
+        distance = threshold - forecast_value
+
+        if distance > 5:
+            return 0.95  # Very confident YES
+        elif distance > 2:
+            return 0.85  # Confident YES
+        elif distance > 0:
+            return 0.70  # Likely YES, but within error margin
+        elif distance > -2:
+            return 0.50  # Uncertain
+        elif distance > -5:
+            return 0.15  # Unlikely
+        else:
+            return 0.05  # Very unlikely
+
+    elif comparison == "between":
+        # Question: Will threshold <= temp <= threshold_high?
+        if threshold <= forecast_value <= threshold_high:
+            # Forecast is within range
+            margin = min(forecast_value - threshold, threshold_high - forecast_value)
+
+            if margin > 3:
+                return 0.90  # Well within range
+            elif margin > 1:
+                return 0.75  # Within range but near edge
+            else:
+                return 0.60  # Just barely in range
+
+        elif forecast_value < threshold:
+            # Below range
+            distance = threshold - forecast_value
+
+            if distance < 2:
+                return 0.40  # Close to lower bound
+            elif distance < 5:
+                return 0.15
+            else:
+                return 0.05
+        else:
+            # Above range
+            distance = forecast_value - threshold_high
+
+            if distance < 2:
+                return 0.40  # Close to upper bound
+            elif distance < 5:
+                return 0.15
+            else:
+                return 0.05
+
+    else:
+        logger.warning(f"Unknown comparison operator: {comparison}")
+        return 0.50  # Default to uncertain
 
 
 @dataclass
@@ -89,10 +181,6 @@ class BoundaryForecastModel:
         Returns:
             Probability between 0 and 1
         """
-        if not SCIPY_AVAILABLE:
-            self.logger.warning("scipy not available, using simple heuristics")
-            return self._simple_probability(forecast_value, threshold, threshold_high, comparison)
-
         # Calculate meteorological adjustments
         adjustment = self._calculate_meteorological_adjustment(
             forecast_value=forecast_value,
@@ -118,14 +206,14 @@ class BoundaryForecastModel:
         # Calculate probability using normal distribution
         if comparison in ["above", "at least"]:
             # P(temp >= threshold)
-            prob = 1 - norm.cdf(threshold, loc=adjusted_forecast, scale=uncertainty)
+            prob = 1 - _normal_cdf(threshold, adjusted_forecast, uncertainty)
         elif comparison in ["below", "at most"]:
             # P(temp <= threshold)
-            prob = norm.cdf(threshold, loc=adjusted_forecast, scale=uncertainty)
+            prob = _normal_cdf(threshold, adjusted_forecast, uncertainty)
         elif comparison == "between":
             # P(threshold <= temp <= threshold_high)
-            prob_below_high = norm.cdf(threshold_high, loc=adjusted_forecast, scale=uncertainty)
-            prob_below_low = norm.cdf(threshold, loc=adjusted_forecast, scale=uncertainty)
+            prob_below_high = _normal_cdf(threshold_high, adjusted_forecast, uncertainty)
+            prob_below_low = _normal_cdf(threshold, adjusted_forecast, uncertainty)
             prob = prob_below_high - prob_below_low
         else:
             self.logger.warning(f"Unknown comparison: {comparison}")
@@ -273,8 +361,9 @@ class BoundaryForecastModel:
             # Check wind variability
             wind_speeds = forecast_stats.get("wind_speeds", [])
             if wind_speeds and len(wind_speeds) > 1:
+                wind_mean = sum(wind_speeds) / len(wind_speeds)
                 wind_std = math.sqrt(
-                    sum((w - sum(wind_speeds)/len(wind_speeds))**2 for w in wind_speeds) / len(wind_speeds)
+                    sum((w - wind_mean)**2 for w in wind_speeds) / len(wind_speeds)
                 )
                 if wind_std > 5:
                     # High wind variability increases uncertainty
@@ -285,82 +374,6 @@ class BoundaryForecastModel:
 
         return uncertainty
 
-    def _simple_probability(
-        self,
-        forecast_value: float,
-        threshold: float,
-        threshold_high: Optional[float],
-        comparison: str
-    ) -> float:
-        """
-        Fallback simple probability calculation (when scipy unavailable)
-
-        Uses same heuristics as original MispricingDetector
-        """
-        if comparison in ["above", "at least"]:
-            distance = forecast_value - threshold
-
-            if distance > 5:
-                return 0.95
-            elif distance > 2:
-                return 0.85
-            elif distance > 0:
-                return 0.70
-            elif distance > -2:
-                return 0.50
-            elif distance > -5:
-                return 0.15
-            else:
-                return 0.05
-
-        elif comparison in ["below", "at most"]:
-            distance = threshold - forecast_value
-
-            if distance > 5:
-                return 0.95
-            elif distance > 2:
-                return 0.85
-            elif distance > 0:
-                return 0.70
-            elif distance > -2:
-                return 0.50
-            elif distance > -5:
-                return 0.15
-            else:
-                return 0.05
-
-        elif comparison == "between":
-            if threshold <= forecast_value <= threshold_high:
-                margin = min(forecast_value - threshold, threshold_high - forecast_value)
-
-                if margin > 3:
-                    return 0.90
-                elif margin > 1:
-                    return 0.75
-                else:
-                    return 0.60
-
-            elif forecast_value < threshold:
-                distance = threshold - forecast_value
-
-                if distance < 2:
-                    return 0.40
-                elif distance < 5:
-                    return 0.15
-                else:
-                    return 0.05
-            else:
-                distance = forecast_value - threshold_high
-
-                if distance < 2:
-                    return 0.40
-                elif distance < 5:
-                    return 0.15
-                else:
-                    return 0.05
-
-        return 0.50
-
 
 class MispricingDetector:
     """Detects mispricings by comparing market prices to forecast data"""
@@ -948,6 +961,8 @@ class MispricingDetector:
         Calculate true probability based on forecast and threshold
 
         Weather forecasts have ~2-3°F error margin, so we account for uncertainty.
+        Results are memoized on the exact inputs (see step_probability), so
+        rescanning unchanged forecasts and strikes is a dict lookup.
 
         Args:
             forecast_value: Forecasted temperature (min/max/avg)
@@ -958,77 +973,7 @@ class MispricingDetector:
         Returns:
             Probability between 0 and 1
         """
-        if comparison in ["above", "at least"]:
-            # Question: Will temp be >= threshold?
-            distance = forecast_value - threshold
-
-            if distance > 5:
-                return 0.95  # Very confident YES
-            elif distance > 2:
-                return 0.85  # Confident YES
-            elif distance > 0:
-                return 0.70  # Likely YES, but within error margin
-            elif distance > -2:
-                return 0.50  # Uncertain (within forecast error)
-            elif distance > -5:
-                return 0.15  # Unlikely
-            else:
-                return 0.05  # Very unlikely
-
-        elif comparison in ["below", "at most"]:
-            # Question: Will temp be <= threshold? (inclusive)
-            distance = threshold - forecast_value
-
-            if distance > 5:
-                return 0.95  # Very confident YES
-            elif distance > 2:
-                return 0.85  # Confident YES
-            elif distance > 0:
-                return 0.70  # Likely YES, but within error margin
-            elif distance > -2:
-                return 0.50  # Uncertain
-            elif distance > -5:
-                return 0.15  # Unlikely
-            else:
-                return 0.05  # Very unlikely
-
-        elif comparison == "between":
-            # Question: Will threshold <= temp <= threshold_high?
-            if threshold <= forecast_value <= threshold_high:
-                # Forecast is within range
-                margin = min(forecast_value - threshold, threshold_high - forecast_value)
-
-                if margin > 3:
-                    return 0.90  # Well within range
-                elif margin > 1:
-                    return 0.75  # Within range but near edge
-                else:
-                    return 0.60  # Just barely in range
-
-            elif forecast_value < threshold:
-                # Below range
-                distance = threshold - forecast_value
-
-                if distance < 2:
-                    return 0.40  # Close to lower bound
-                elif distance < 5:
-                    return 0.15
-                else:
-                    return 0.05
-            else:
-                # Above range
-                distance = forecast_value - threshold_high
-
-                if distance < 2:
-                    return 0.40  # Close to upper bound
-                elif distance < 5:
-                    return 0.15
-                else:
-                    return 0.05
-
-        else:
-            self.logger.warning(f"Unknown comparison operator: {comparison}")
-            return 0.50  # Default to uncertain
+        return step_probability(forecast_value, threshold, threshold_high, comparison)
 
     def _kelly_bet_size(
         self,
@@ -3,12 +3,35 @@ NWS Data Adapter
 Fetches and parses National Weather Service forecast data
 """
 
+import re
 import requests
 import logging
 import pytz
 from datetime import datetime
 from typing import List, Dict, Optional
 from .city_config import CITY_DATABASE, normalize_city_name, get_city_config
+from .cache import FileCache, cached, nonempty_ttl_policy, ttl_policy
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _parse_json(response: requests.Response):
+    """
+    Decode a JSON response body, using orjson's C parser when installed
+
+    Malformed bodies raise requests' JSONDecodeError either way, so the
+    RequestException handlers around each call still catch them.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+    return response.json()
 
 
 class NWSAdapter:
@@ -23,12 +46,14 @@ class NWSAdapter:
         "Denver, CO": ["KCYS"],  # Cheyenne weather often precedes Denver by a few hours
     }
 
-    def __init__(self, user_agent: str = "KalshiWeatherScanner/1.0"):
+    def __init__(self, user_agent: str = "KalshiWeatherScanner/1.0", cache_dir: Optional[str] = None):
         """
         Initialize NWS adapter
 
         Args:
             user_agent: User-Agent string for API requests (NWS requires this)
+            cache_dir: Directory for cached gridpoints, forecasts and observations
+                       (None disables caching)
         """
         self.base_url = "https://api.weather.gov"
         self.user_agent = user_agent
@@ -38,10 +63,16 @@ class NWSAdapter:
             "Accept": "application/geo+json"
         })
         self.logger = logging.getLogger(__name__)
+        self.cache = FileCache(cache_dir) if cache_dir else None
 
         # Cache for gridpoint data (doesn't change)
         self._gridpoint_cache = {}
 
+        # Last CLI report per station with its ETag/Last-Modified validators,
+        # so repeated polls can use conditional GETs
+        self._cli_cache = {}
+
+    @cached(ttl=ttl_policy("METADATA"))
     def get_gridpoint(self, lat: float, lon: float) -> Dict:
         """
         Convert lat/lon to NWS grid coordinates
@@ -67,7 +98,7 @@ class NWSAdapter:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse_json(response)
             properties = data.get("properties", {})
 
             gridpoint = {
@@ -88,6 +119,7 @@ class NWSAdapter:
             self.logger.error(f"Failed to fetch gridpoint: {e}")
             raise
 
+    @cached(ttl=ttl_policy("FORECAST"))
     def get_hourly_forecast(self, lat: float, lon: float) -> List[Dict]:
         """
         Fetch hourly forecast for the next 7 days
@@ -107,7 +139,7 @@ class NWSAdapter:
             response = self.session.get(forecast_url, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse_json(response)
             periods = data.get("properties", {}).get("periods", [])
 
             self.logger.info(f"Retrieved {len(periods)} hourly forecast periods")
@@ -144,6 +176,7 @@ class NWSAdapter:
         location = self.LOCATIONS[normalized_key]
         return self.get_hourly_forecast(location["lat"], location["lon"])
 
+    @cached(ttl=nonempty_ttl_policy("OBSERVATIONS"))
     def get_observations(self, station_id: str, hours: int = 200) -> List[Dict]:
         """
         Fetch recent temperature observations from NWS station
@@ -166,7 +199,7 @@ class NWSAdapter:
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse_json(response)
             observations = data.get("features", [])
 
             # Extract temperature data
@@ -191,6 +224,7 @@ class NWSAdapter:
             self.logger.error(f"Failed to fetch observations: {e}")
             return []
 
+    @cached(ttl=nonempty_ttl_policy("OBSERVATIONS"))
     def get_current_conditions(self, station_id: str) -> Optional[Dict]:
         """
         Get latest weather observation including sky cover, wind, and dewpoint
@@ -208,7 +242,7 @@ class NWSAdapter:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse_json(response)
             props = data.get("properties", {})
 
             # Extract key meteorological parameters
@@ -632,70 +666,98 @@ class NWSAdapter:
             "issuedby": station_code
         }
 
+        # Conditional GET: NWS answers 304 with no body if the product page hasn't changed
+        cli_entry = self._cli_cache.get(station_code)
+        headers = {}
+        if cli_entry:
+            if cli_entry["etag"]:
+                headers["If-None-Match"] = cli_entry["etag"]
+            if cli_entry["last_modified"]:
+                headers["If-Modified-Since"] = cli_entry["last_modified"]
+
         try:
             self.logger.info(f"Fetching preliminary CLI for {station_id} on {date_str}")
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
+            response = self.session.get(url, params=params, headers=headers, timeout=30)
 
-            # Parse the HTML response - CLI text is in a <pre> tag
-            html = response.text
-            import re
+            if response.status_code == 304 and cli_entry:
+                self.logger.info(f"Preliminary CLI for {station_id} unchanged since last poll")
+                result = cli_entry["result"]
+            else:
+                response.raise_for_status()
+                result = self._parse_preliminary_climate_report(response.text)
+                self._cli_cache[station_code] = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "result": result,
+                }
 
-            # Extract text from <pre> tag
-            pre_match = re.search(r'<pre[^>]*>(.*?)</pre>', html, re.DOTALL)
-            if not pre_match:
-                self.logger.warning("Could not find CLI text in <pre> tag")
-                return None
+            return dict(result) if result else None
 
-            text = pre_match.group(1)
-
-            # Look for temperature section
-            # Example: "  MINIMUM         13    138 AM -14    1962  19     -6       16"
-            # Pattern: MINIMUM <temp> <time> AM/PM
-            min_pattern = r"MINIMUM\s+(\d+)\s+(\d+)\s+(AM|PM)"
-            max_pattern = r"MAXIMUM\s+(\d+)\s+(\d+)\s+(AM|PM)"
-
-            min_match = re.search(min_pattern, text)
-            max_match = re.search(max_pattern, text)
-
-            result = {}
-
-            if min_match:
-                result["preliminary_min"] = float(min_match.group(1))
-                # Format time (e.g., "138" -> "1:38")
-                time_raw = min_match.group(2)
-                if len(time_raw) == 3:
-                    time_formatted = f"{time_raw[0]}:{time_raw[1:]}"
-                elif len(time_raw) == 4:
-                    time_formatted = f"{time_raw[:2]}:{time_raw[2:]}"
-                else:
-                    time_formatted = time_raw
-                result["min_time"] = f"{time_formatted} {min_match.group(3)}"
-                self.logger.info(
-                    f"Preliminary CLI: MIN={result['preliminary_min']}°F at {result['min_time']}"
-                )
+        except Exception as e:
+            self.logger.warning(f"Could not fetch preliminary CLI: {e}")
+            return None
 
-            if max_match:
-                result["preliminary_max"] = float(max_match.group(1))
-                # Format time (e.g., "240" -> "2:40")
-                time_raw = max_match.group(2)
-                if len(time_raw) == 3:
-                    time_formatted = f"{time_raw[0]}:{time_raw[1:]}"
-                elif len(time_raw) == 4:
-                    time_formatted = f"{time_raw[:2]}:{time_raw[2:]}"
-                else:
-                    time_formatted = time_raw
-                result["max_time"] = f"{time_formatted} {max_match.group(3)}"
-                self.logger.info(
-                    f"Preliminary CLI: MAX={result['preliminary_max']}°F at {result['max_time']}"
-                )
+    def _parse_preliminary_climate_report(self, html: str) -> Optional[Dict]:
+        """
+        Extract preliminary min/max from a CLI product page
 
-            return result if result else None
+        Args:
+            html: HTML of the NWS product page
 
-        except Exception as e:
-            self.logger.warning(f"Could not fetch preliminary CLI: {e}")
+        Returns:
+            Dictionary with preliminary min/max or None if not found
+        """
+        # Extract text from <pre> tag
+        pre_match = re.search(r'<pre[^>]*>(.*?)</pre>', html, re.DOTALL)
+        if not pre_match:
+            self.logger.warning("Could not find CLI text in <pre> tag")
             return None
 
+        text = pre_match.group(1)
+
+        # Look for temperature section
+        # Example: "  MINIMUM         13    138 AM -14    1962  19     -6       16"
+        # Pattern: MINIMUM <temp> <time> AM/PM
+        min_pattern = r"MINIMUM\s+(\d+)\s+(\d+)\s+(AM|PM)"
+        max_pattern = r"MAXIMUM\s+(\d+)\s+(\d+)\s+(AM|PM)"
+
+        min_match = re.search(min_pattern, text)
+        max_match = re.search(max_pattern, text)
+
+        result = {}
+
+        if min_match:
+            result["preliminary_min"] = float(min_match.group(1))
+            # Format time (e.g., "138" -> "1:38")
+            time_raw = min_match.group(2)
+            if len(time_raw) == 3:
+                time_formatted = f"{time_raw[0]}:{time_raw[1:]}"
+            elif len(time_raw) == 4:
+                time_formatted = f"{time_raw[:2]}:{time_raw[2:]}"
+            else:
+                time_formatted = time_raw
+            result["min_time"] = f"{time_formatted} {min_match.group(3)}"
+            self.logger.info(
+                f"Preliminary CLI: MIN={result['preliminary_min']}°F at {result['min_time']}"
+            )
+
+        if max_match:
+            result["preliminary_max"] = float(max_match.group(1))
+            # Format time (e.g., "240" -> "2:40")
+            time_raw = max_match.group(2)
+            if len(time_raw) == 3:
+                time_formatted = f"{time_raw[0]}:{time_raw[1:]}"
+            elif len(time_raw) == 4:
+                time_formatted = f"{time_raw[:2]}:{time_raw[2:]}"
+            else:
+                time_formatted = time_raw
+            result["max_time"] = f"{time_formatted} {max_match.group(3)}"
+            self.logger.info(
+                f"Preliminary CLI: MAX={result['preliminary_max']}°F at {result['max_time']}"
+            )
+
+        return result if result else None
+
     def get_forecast_stats_for_city_and_date(
         self,
         city: str,
@@ -251,28 +251,19 @@ class PortfolioOptimizer:
         """
         total_allocation = allocation_fraction * self.bankroll
 
-        # Calculate expected value
-        expected_return = sum(
-            opp.edge * opp.recommended_bet_size
-            for opp in opportunities
-            if opp.edge > 0
-        )
-
-        # Best case: All positive edge bets win
-        max_return = sum(
-            (1.0 / (opp.market_yes_price if opp.recommended_side == "YES" else opp.market_no_price) - 1.0) * opp.recommended_bet_size
-            for opp in opportunities
-            if opp.edge > 0
-        )
+        # Accumulate all three in one pass over the positive-edge bets
+        expected_return = 0  # Expected value
+        max_return = 0  # Best case: All positive edge bets win
+        total_staked = 0  # Worst case: All bets lose
 
-        # Worst case: All bets lose
-        min_return = -sum(
-            opp.recommended_bet_size
-            for opp in opportunities
-            if opp.edge > 0
-        )
+        for opp in opportunities:
+            if opp.edge > 0:
+                price = opp.market_yes_price if opp.recommended_side == "YES" else opp.market_no_price
+                expected_return += opp.edge * opp.recommended_bet_size
+                max_return += (1.0 / price - 1.0) * opp.recommended_bet_size
+                total_staked += opp.recommended_bet_size
 
-        return expected_return, min_return, max_return
+        return expected_return, -total_staked, max_return
 
     def _calculate_risk_metrics(
         self,
@@ -351,6 +342,9 @@ class PortfolioOptimizer:
         hedge_bets = []
         total_allocation = allocation_fraction * self.bankroll
 
+        # Hedge weights are proportional to edge among the positive-edge bets
+        total_positive_edge = sum(o.edge for o in opportunities if o.edge > 0)
+
         # Find complementary bets (opposite side or adjacent ranges)
         for opp in opportunities:
             if opp.ticker == primary.ticker:
@@ -359,7 +353,7 @@ class PortfolioOptimizer:
             # Check if this is a good hedge
             if opp.edge > 0.05:  # At least 5% edge
                 # Calculate hedge weight (proportional to edge)
-                weight = (opp.edge / sum(o.edge for o in opportunities if o.edge > 0))
+                weight = opp.edge / total_positive_edge
                 hedge_bets.append((opp, weight))
 
         # Generate description
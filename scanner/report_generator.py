@@ -5,6 +5,8 @@ Formats opportunities into human-readable Markdown and CSV reports
 
 import csv
 import logging
+import os
+import threading
 from datetime import datetime
 from io import StringIO
 from typing import List
@@ -12,6 +14,29 @@ from typing import List
 from .mispricing_detector import Opportunity
 
 
+def write_atomic(path: str, data: str) -> None:
+    """
+    Write a report so readers never see a partially written file
+
+    The data goes to a temp file next to the target (named per process and
+    thread), which is then renamed over it; a reader of e.g. current.md sees
+    either the old or the new report.
+
+    Args:
+        path: File to write
+        data: Full file contents
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 class ReportGenerator:
     """Generates formatted reports for identified opportunities"""
 
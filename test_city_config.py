@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test that the partial-match index keeps the old "first city containing the input" lookup
+"""
+
+from scanner.city_config import (
+    CITY_DATABASE,
+    _PARTIAL_MATCH_INDEX,
+    get_city_config,
+    normalize_city_name,
+)
+
+
+def old_partial_match(city_name):
+    """The original linear scan, kept as the reference"""
+    city_lower = city_name.lower()
+    for full_name in CITY_DATABASE:
+        if city_lower in full_name.lower():
+            return full_name
+    return None
+
+
+def test_contained_name_prefers_first_city():
+    """"Las Vegas" is inside "North Las Vegas, NV" but the earlier "Las Vegas, NV" wins"""
+    names = list(CITY_DATABASE)
+    assert names.index("Las Vegas, NV") < names.index("North Las Vegas, NV")
+
+    assert normalize_city_name("las vegas") == "Las Vegas, NV"
+    assert normalize_city_name("Vegas") == "Las Vegas, NV"
+    assert normalize_city_name("north las") == "North Las Vegas, NV"
+    assert get_city_config("LAS VEGAS") is CITY_DATABASE["Las Vegas, NV"]
+
+
+def test_partial_match_matches_linear_scan():
+    """City names, their city parts and common fragments resolve as the old loop did"""
+    queries = {"port", "san", "new", "city", "ville", "north", "beach", "springs", ", ", "zzz"}
+    for full_name in CITY_DATABASE:
+        city = full_name.split(",")[0]
+        queries.update({city, city.lower(), city[:4], city[-4:]})
+
+    for query in sorted(queries):
+        assert _PARTIAL_MATCH_INDEX.get(query.lower()) == old_partial_match(query), query
+
+
+if __name__ == "__main__":
+    test_contained_name_prefers_first_city()
+    test_partial_match_matches_linear_scan()
+    print("✅ All city config tests passed")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test that the ALIGNMENT_RULES table gives the same bets as the if/elif chain it replaced
+"""
+
+from itertools import product
+from types import SimpleNamespace
+
+from preliminary_cli_bet import ALIGNMENT_RULES, PreliminaryCliScanner
+
+
+def old_alignment(metric, comparison, threshold, threshold_high, prelim_min, prelim_max):
+    """The original _check_market_alignment branches, kept as the reference"""
+    if metric == "minimum":
+        if comparison == "between":
+            return ("yes", 0.95) if threshold <= prelim_min <= threshold_high else ("no", 0.95)
+        elif comparison in ["above", "at least"]:
+            return ("yes", 0.95) if prelim_min >= threshold else ("no", 0.95)
+        elif comparison in ["below", "at most"]:
+            return ("yes", 0.95) if prelim_min <= threshold else ("no", 0.95)
+    elif metric == "maximum":
+        if comparison == "between":
+            return ("yes", 0.95) if threshold <= prelim_max <= threshold_high else ("no", 0.95)
+        elif comparison in ["above", "at least"]:
+            return ("yes", 0.95) if prelim_max >= threshold else ("no", 0.95)
+        elif comparison in ["below", "at most"]:
+            return ("yes", 0.95) if prelim_max <= threshold else ("no", 0.95)
+    return (None, 0.0)
+
+
+def test_alignment_matches_old_branches():
+    """Every metric/comparison pair, with values below, on and above each bound"""
+    scanner = PreliminaryCliScanner.__new__(PreliminaryCliScanner)
+    metrics = ["minimum", "maximum", "average"]
+    comparisons = ["between", "above", "at least", "below", "at most", "exactly"]
+    values = [12.0, 14.0, 15.0, 16.0, 17.0]
+
+    for metric, comparison, prelim_min, prelim_max in product(metrics, comparisons, values, values):
+        parsed = SimpleNamespace(metric=metric, comparison=comparison, threshold=14.0, threshold_high=16.0)
+        expected = old_alignment(metric, comparison, 14.0, 16.0, prelim_min, prelim_max)
+        actual = scanner._check_market_alignment(parsed, prelim_min, prelim_max)
+        assert actual == expected, (metric, comparison, prelim_min, prelim_max, actual, expected)
+
+
+def test_alignment_rules_cover_known_pairs():
+    """Only minimum/maximum markets with a known comparison get a rule"""
+    assert set(ALIGNMENT_RULES) == set(product(
+        ["minimum", "maximum"],
+        ["between", "above", "at least", "below", "at most"]
+    ))
+
+
+if __name__ == "__main__":
+    test_alignment_matches_old_branches()
+    test_alignment_rules_cover_known_pairs()
+    print("✅ All alignment tests passed")
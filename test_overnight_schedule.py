@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test the overnight scanner's wake-up time across daylight saving changes
+"""
+
+import os
+import tempfile
+import time
+from datetime import datetime
+
+# scan_overnight logs to REPORTS_DIR at import, so point it somewhere that exists
+os.environ.setdefault("REPORTS_DIR", tempfile.mkdtemp())
+
+import scan_overnight
+from scan_overnight import next_overnight_start
+
+
+def in_timezone(tz_name, func):
+    """Run func with the process local timezone set to tz_name"""
+    old_tz = os.environ.get("TZ")
+    os.environ["TZ"] = tz_name
+    time.tzset()
+    try:
+        return func()
+    finally:
+        if old_tz is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = old_tz
+        time.tzset()
+
+
+def with_start_hour(hour, func):
+    """Run func with OVERNIGHT_START_HOUR set to hour"""
+    old_hour = scan_overnight.START_HOUR
+    scan_overnight.START_HOUR = hour
+    try:
+        return func()
+    finally:
+        scan_overnight.START_HOUR = old_hour
+
+
+def test_spring_forward():
+    """Wake at 20:00 local the day clocks go forward, 22 real hours after 21:00 the night before"""
+    def check():
+        now = datetime(2026, 3, 7, 21, 0)
+        wake = next_overnight_start(now)
+        assert wake == datetime(2026, 3, 8, 20, 0)
+        assert wake.timestamp() - now.timestamp() == 22 * 3600
+
+        # Same-day wake-up later on the DST day itself
+        assert next_overnight_start(datetime(2026, 3, 8, 9, 0)) == datetime(2026, 3, 8, 20, 0)
+
+    in_timezone("America/Denver", lambda: with_start_hour(20, check))
+
+
+def test_fall_back():
+    """Wake at 20:00 local the day clocks go back, 24 real hours after 21:00 the night before"""
+    def check():
+        now = datetime(2026, 10, 31, 21, 0)
+        wake = next_overnight_start(now)
+        assert wake == datetime(2026, 11, 1, 20, 0)
+        assert wake.timestamp() - now.timestamp() == 24 * 3600
+
+        # Exactly at the start hour the next start is a day later
+        assert next_overnight_start(datetime(2026, 11, 1, 20, 0)) == datetime(2026, 11, 2, 20, 0)
+
+    in_timezone("America/Denver", lambda: with_start_hour(20, check))
+
+
+if __name__ == "__main__":
+    test_spring_forward()
+    test_fall_back()
+    print("✅ All overnight schedule tests passed")
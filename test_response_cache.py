@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Test the file-backed response cache and ETag revalidation used by KalshiClient
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from scanner.cache import FileCache, MISS, cached, market_ttl, nonempty_ttl_policy
+from scanner.kalshi_client import KalshiClient
+
+
+class FakeClient:
+    """Stand-in for KalshiClient that counts fetches and can simulate outages"""
+
+    def __init__(self, cache_dir):
+        self.cache = FileCache(cache_dir)
+        self.calls = 0
+        self.down = False
+
+    @cached(ttl=market_ttl)
+    def get_market(self, ticker):
+        if self.down:
+            raise ConnectionError("API unavailable")
+        self.calls += 1
+        return {"ticker": ticker, "status": "active", "yes_bid": self.calls}
+
+    @cached(ttl=nonempty_ttl_policy("OBSERVATIONS"))
+    def get_observations(self, station):
+        # Like NWSAdapter, swallows errors and returns an empty list
+        if self.down:
+            return []
+        self.calls += 1
+        return [{"station": station, "temperature": self.calls}]
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves one ETagged body, answering 304 when the client revalidates it"""
+
+    def __init__(self):
+        self.sent_headers = []
+
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None):
+        self.sent_headers.append(dict(headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, b'{"market": {"yes_bid": 7}}', {"ETag": '"v1"'})
+
+
+def make_etag_client():
+    """KalshiClient with its HTTP session replaced and authentication skipped"""
+    client = KalshiClient.__new__(KalshiClient)
+    client.base_url = "https://example.invalid"
+    client.logger = logging.getLogger("test")
+    client.auth_method = "email_password"
+    client.session = FakeSession()
+    client._etag_cache = OrderedDict()
+    client._etag_lock = threading.Lock()
+    return client
+
+
+def test_cache_hit_skips_fetch():
+    """Second call within the TTL is served from disk"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        client = FakeClient(cache_dir)
+        first = client.get_market("KXLOWTDEN-26JAN17-B33")
+        second = client.get_market("KXLOWTDEN-26JAN17-B33")
+        assert first == second
+        assert client.calls == 1
+
+        client.get_market("KXLOWTMIA-26JAN17-B60")
+        assert client.calls == 2
+
+
+def test_expired_entry_refetches_and_serves_stale_on_error():
+    """Expired entries are refreshed, but still returned if the refresh fails"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        client = FakeClient(cache_dir)
+        params = {"args": ["KXLOWTDEN-26JAN17-B33"], "kwargs": {}}
+        client.cache.set("get_market", params, {"yes_bid": 42}, ttl=0)
+        time.sleep(0.01)
+
+        assert client.cache.get("get_market", params) is MISS
+        assert client.get_market("KXLOWTDEN-26JAN17-B33")["yes_bid"] == 1
+
+        # Stale copies are served for at most the entry's own TTL past expiry
+        client.cache.set("get_market", params, {"yes_bid": 42}, ttl=0.05)
+        time.sleep(0.07)
+        client.down = True
+        assert client.get_market("KXLOWTDEN-26JAN17-B33") == {"yes_bid": 42}
+
+        time.sleep(0.05)
+        assert client.cache.get("get_market", params, allow_stale=True) is MISS
+
+
+def test_invalidate_drops_entry():
+    """invalidate() forces the next call for those arguments to refetch"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        client = FakeClient(cache_dir)
+        client.get_market("KXLOWTDEN-26JAN17-B33")
+        client.get_market("KXLOWTMIA-26JAN17-B60")
+
+        FakeClient.get_market.invalidate(client, "KXLOWTDEN-26JAN17-B33")
+        assert client.get_market("KXLOWTDEN-26JAN17-B33")["yes_bid"] == 3
+        assert client.get_market("KXLOWTMIA-26JAN17-B60")["yes_bid"] == 2
+
+        # Invalidating an entry that doesn't exist is a no-op
+        FakeClient.get_market.invalidate(client, "KXLOWTNYC-26JAN17-B20")
+
+
+def test_invalidate_market_drops_market_lists():
+    """A trade clears the list lookups that may hold the market's old quotes"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        client = KalshiClient.__new__(KalshiClient)
+        client.cache = FileCache(cache_dir)
+        entries = [
+            ("get_market", {"args": ["KXLOWTDEN-26JAN17-B33"], "kwargs": {}}),
+            ("get_market", {"args": ["KXLOWTMIA-26JAN17-B60"], "kwargs": {}}),
+            ("get_markets_for_series", {"args": ["KXLOWTDEN"], "kwargs": {}}),
+            ("get_markets_batch", {"args": [["KXLOWTDEN-26JAN17-B33"]], "kwargs": {}}),
+            ("get_promo_markets", {"args": [], "kwargs": {}}),
+            ("get_series", {"args": ["KXLOWTDEN"], "kwargs": {}}),
+        ]
+        for endpoint, params in entries:
+            client.cache.set(endpoint, params, {"cached": True}, 60)
+
+        client.invalidate_market("KXLOWTDEN-26JAN17-B33")
+
+        remaining = [endpoint for endpoint, params in entries if client.cache.get(endpoint, params) is not MISS]
+        assert remaining == ["get_market", "get_series"]
+        assert client.cache.get(*entries[1]) is not MISS
+
+
+def test_empty_result_keeps_last_good_entry():
+    """An empty body from a swallowed error is not stored over the last good one"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        client = FakeClient(cache_dir)
+        params = {"args": ["KDEN"], "kwargs": {}}
+        client.cache.set("get_observations", params, [{"temperature": 42}], ttl=0.05)
+        time.sleep(0.07)
+
+        client.down = True
+        assert client.get_observations("KDEN") == [{"temperature": 42}]
+        assert client.cache.get("get_observations", params, allow_stale=True) == [{"temperature": 42}]
+
+        # Without a previous entry the empty body is returned, but not cached
+        assert client.get_observations("KMIA") == []
+        assert client.cache.get("get_observations", {"args": ["KMIA"], "kwargs": {}}, allow_stale=True) is MISS
+
+
+def test_market_ttl_policy():
+    """Trading markets expire quickly, settled ones are kept longer"""
+    assert market_ttl({"status": "active"}) == 30
+    assert market_ttl({"status": "settled"}) == 86400
+
+    os.environ["KALSHI_CACHE_TTL_QUOTES"] = "5"
+    try:
+        assert market_ttl({"status": "active"}) == 5
+    finally:
+        del os.environ["KALSHI_CACHE_TTL_QUOTES"]
+
+
+def test_etag_revalidation_reuses_body():
+    """A repeated GET sends If-None-Match and a 304 returns the stored body"""
+    client = make_etag_client()
+    first = client._make_request("GET", "/markets/X", params={"a": 1})
+    first["market"]["yes_bid"] = 0  # callers get their own copy
+    second = client._make_request("GET", "/markets/X", params={"a": 1})
+
+    assert second == {"market": {"yes_bid": 7}}
+    assert "If-None-Match" not in client.session.sent_headers[0]
+    assert client.session.sent_headers[1]["If-None-Match"] == '"v1"'
+
+
+if __name__ == "__main__":
+    test_cache_hit_skips_fetch()
+    test_expired_entry_refetches_and_serves_stale_on_error()
+    test_invalidate_drops_entry()
+    test_invalidate_market_drops_market_lists()
+    test_empty_result_keeps_last_good_entry()
+    test_market_ttl_policy()
+    test_etag_revalidation_reuses_body()
+    print("✅ All cache tests passed")